@@ -9,8 +9,8 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from PyQt6.QtWidgets import QApplication, QMessageBox
-from PyQt6.QtCore import Qt
-from utils.logger import get_logger
+from PyQt6.QtCore import Qt, QTimer
+from utils.logger import get_logger, flush_logs, LOG_FLUSH_INTERVAL
 
 logger = get_logger(__name__)
 
@@ -52,6 +52,11 @@ def main():
         main_window.show()
         logger.info("Application window displayed")
 
+        # Write buffered log records out regularly, even while the app is idle
+        log_flush_timer = QTimer()
+        log_flush_timer.timeout.connect(flush_logs)
+        log_flush_timer.start(LOG_FLUSH_INTERVAL * 1000)
+
         # Start the Qt event loop
         logger.debug("Starting Qt event loop")
         exit_code = app.exec()
@@ -2,13 +2,17 @@
 Tests for the backup and restore functionality.
 """
 
+import io
 import os
 import time
 import pytest
 import tempfile
 from datetime import datetime
 from db.models import Snippet
-from utils.backup import backup_database, restore_database, cleanup_old_backups, list_backups
+from utils.backup import (
+    backup_database, restore_database, cleanup_old_backups, list_backups,
+    export_snippets_to_json, export_snippets_to_file, import_snippets_from_json
+)
 
 
 def test_backup_database(database, temp_db_path):
@@ -148,6 +152,143 @@ def test_list_backups_nonexistent_directory():
     assert len(backups) == 0
 
 
+# ========================================
+# JSON EXPORT/IMPORT TESTS
+# ========================================
+
+def test_export_import_roundtrip(database):
+    """Test that exported snippets are imported back in one batch."""
+    database.insert_snippet(Snippet(name='First', command_text='echo 1', tags='a'))
+    database.insert_snippet(Snippet(name='Second', command_text='echo 2', description='two'))
+
+    json_data = export_snippets_to_json(database.connection)
+    stats = import_snippets_from_json(database.connection, json_data, replace_existing=True)
+
+    assert stats == {'total': 2, 'imported': 2, 'skipped': 0, 'failed': 0}
+    names = sorted(s.name for s in database.get_all_snippets())
+    assert names == ['First', 'Second']
+
+
+def test_export_to_file_roundtrip(database, tmp_path):
+    """Test that a newline-delimited export is imported back."""
+    database.insert_snippet(Snippet(name='First', command_text='echo 1', tags='a'))
+    database.insert_snippet(Snippet(name='Second', command_text='echo 2'))
+
+    file_path = tmp_path / 'snippets.ndjson'
+    assert export_snippets_to_file(database.connection, str(file_path)) == 2
+    # Header line plus one line per snippet
+    assert len(file_path.read_text(encoding='utf-8').splitlines()) == 3
+
+    json_data = file_path.read_text(encoding='utf-8')
+    stats = import_snippets_from_json(database.connection, json_data, replace_existing=True)
+
+    assert stats['imported'] == 2
+    names = sorted(s.name for s in database.get_all_snippets())
+    assert names == ['First', 'Second']
+
+
+def test_import_from_file(database, tmp_path):
+    """Test importing snippets streamed from a binary file."""
+    database.insert_snippet(Snippet(name='First', command_text='echo 1'))
+    database.insert_snippet(Snippet(name='Second', command_text='echo 2'))
+
+    file_path = tmp_path / 'snippets.json'
+    file_path.write_text(export_snippets_to_json(database.connection), encoding='utf-8')
+
+    with open(file_path, 'rb') as f:
+        stats = import_snippets_from_json(database.connection, f, replace_existing=True)
+
+    assert stats == {'total': 2, 'imported': 2, 'skipped': 0, 'failed': 0}
+    names = sorted(s.name for s in database.get_all_snippets())
+    assert names == ['First', 'Second']
+
+
+def test_import_streams_json_document_with_ijson(database, monkeypatch):
+    """Test that a JSON document read from a binary file is streamed with ijson."""
+    import utils.backup
+    monkeypatch.setattr(utils.backup, 'ijson', pytest.importorskip('ijson'))
+    database.insert_snippet(Snippet(name='First', command_text='echo 1'))
+    database.insert_snippet(Snippet(name='Second', command_text='echo 2'))
+    json_bytes = export_snippets_to_json(database.connection).encode('utf-8')
+
+    stats = import_snippets_from_json(database.connection, io.BytesIO(json_bytes), replace_existing=True)
+
+    assert stats == {'total': 2, 'imported': 2, 'skipped': 0, 'failed': 0}
+    names = sorted(s.name for s in database.get_all_snippets())
+    assert names == ['First', 'Second']
+
+
+def test_import_rejects_invalid_document_with_ijson(database, monkeypatch):
+    """Test that ijson streaming rejects a document without version and snippets keys."""
+    import utils.backup
+    monkeypatch.setattr(utils.backup, 'ijson', pytest.importorskip('ijson'))
+    database.insert_snippet(Snippet(name='Keep', command_text='ls'))
+    json_bytes = b'{"version": 1, "items": [{"name": "x", "command_text": "ls"}]}'
+
+    with pytest.raises(Exception, match="Invalid backup format"):
+        import_snippets_from_json(database.connection, io.BytesIO(json_bytes), replace_existing=True)
+
+    assert [s.name for s in database.get_all_snippets()] == ['Keep']
+
+
+def test_import_counts_failed_snippets(database):
+    """Test that a bad snippet fails on its own without losing the others."""
+    json_data = (
+        '{"version": 1, "snippets": ['
+        '{"name": "Good", "description": "", "command_text": "ls", "tags": "", "created_at": "2024-01-01T00:00:00"},'
+        '{"name": "Bad", "description": ""}'
+        ']}'
+    )
+
+    stats = import_snippets_from_json(database.connection, json_data)
+
+    assert stats['imported'] == 1
+    assert stats['failed'] == 1
+    assert [s.name for s in database.get_all_snippets()] == ['Good']
+
+
+@pytest.mark.parametrize('json_data', [
+    '{"version": "2.1.0", "name": "x"}',
+    '{"version": 3}\n{"event": "x"}\n{"event": "y"}\n',
+])
+def test_import_rejects_non_backup_json(database, json_data):
+    """Test that a non-backup JSON file fails and leaves existing snippets intact."""
+    database.insert_snippet(Snippet(name='Keep', command_text='ls'))
+
+    with pytest.raises(Exception, match="Failed to import snippets"):
+        import_snippets_from_json(database.connection, json_data, replace_existing=True)
+    with pytest.raises(Exception, match="Failed to import snippets"):
+        import_snippets_from_json(database.connection, io.BytesIO(json_data.encode('utf-8')),
+                                  replace_existing=True)
+
+    assert [s.name for s in database.get_all_snippets()] == ['Keep']
+
+
+def test_import_restores_connection_pragmas(database):
+    """Test that an import leaves the caller's connection settings unchanged."""
+    connection = database.connection
+    before = [connection.execute(f"PRAGMA {p}").fetchone()[0] for p in ('cache_size', 'temp_store')]
+
+    import_snippets_from_json(connection, export_snippets_to_json(connection))
+
+    after = [connection.execute(f"PRAGMA {p}").fetchone()[0] for p in ('cache_size', 'temp_store')]
+    assert after == before
+
+
+def test_import_defaults_missing_timestamps(database):
+    """Test that snippets without timestamps get the current time, not NULL."""
+    json_data = '{"version": 1, "snippets": [{"name": "NoDates", "command_text": "ls"}]}'
+
+    stats = import_snippets_from_json(database.connection, json_data)
+
+    assert stats['imported'] == 1
+    row = database.connection.execute(
+        "SELECT last_used, created_at FROM snippets WHERE name = 'NoDates'"
+    ).fetchone()
+    assert row[0] is not None
+    assert row[1] is not None
+
+
 # ========================================
 # SNAPSHOT TESTS
 # ========================================
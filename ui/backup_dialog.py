@@ -348,15 +348,13 @@ class BackupDialog(QDialog):
                 if reply == QMessageBox.StandardButton.No:
                     return
 
-            # Read and import data
-            with open(file_path, 'r', encoding='utf-8') as f:
-                json_data = f.read()
-
-            stats = import_snippets_from_json(
-                self.db_connection,
-                json_data,
-                self.replace_checkbox.isChecked()
-            )
+            # Import data, streaming it from the file
+            with open(file_path, 'rb') as f:
+                stats = import_snippets_from_json(
+                    self.db_connection,
+                    f,
+                    self.replace_checkbox.isChecked()
+                )
 
             logger.info("Import completed: %s", stats)
             QMessageBox.information(
@@ -5,7 +5,7 @@ Main application window for the Command Snippet Management Application.
 from PyQt6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QTableWidget,
     QTableWidgetItem, QLineEdit, QPushButton, QMessageBox, QStatusBar,
-    QHeaderView, QAbstractItemView, QSplitter, QTextEdit, QLabel,
+    QHeaderView, QAbstractItemView, QSplitter, QPlainTextEdit, QLabel,
     QFrame, QToolBar, QSizePolicy, QApplication, QListWidget, QListWidgetItem
 )
 from PyQt6.QtCore import Qt, QTimer
@@ -60,16 +60,13 @@ class MainWindow(QMainWindow):
             except Exception:
                 logging.debug("MainWindow: could not disable native menu bar (platform may ignore)")
             app = QApplication.instance()
-            app_styles = ModernDarkTheme.get_application_stylesheet()
+            # Application, dialog and custom-widget rules are installed as a
+            # single stylesheet so Qt parses the CSS only once.
+            app_styles = (ModernDarkTheme.get_application_stylesheet()
+                          + ModernDarkTheme.get_dialog_styles()
+                          + ModernDarkTheme.get_widget_styles())
             app.setStyleSheet(app_styles)
             logging.debug("MainWindow: applied application stylesheet length=%d", len(app_styles))
-
-            # Apply additional dialog styles
-            dialog_styles = ModernDarkTheme.get_dialog_styles()
-            current_stylesheet = app.styleSheet() or ""
-            app.setStyleSheet(current_stylesheet + dialog_styles)
-            logging.debug("MainWindow: appended dialog stylesheet length=%d, total length now=%d",
-                          len(dialog_styles), len(app.styleSheet() or ""))
         except Exception as e:
             logging.exception("MainWindow: failed to apply theme: %s", e)
 
@@ -235,10 +232,12 @@ class MainWindow(QMainWindow):
         right_layout.addWidget(separator)
 
         # Command text display
-        self.command_preview = QTextEdit()
+        self.command_preview = QPlainTextEdit()
         # Give the preview a specific object name so stylesheet rules can target it
         self.command_preview.setObjectName('command_edit')
         self.command_preview.setReadOnly(True)
+        # Read-only: no need to record an undo history for each preview
+        self.command_preview.setUndoRedoEnabled(False)
         self.command_preview.setFont(QFont("SF Mono, Monaco, Cascadia Code, Roboto Mono", 12))
         self.command_preview.setPlaceholderText("Select a snippet to preview its command...")
         self.command_preview.setMinimumHeight(200)
@@ -763,18 +762,18 @@ class MainWindow(QMainWindow):
 
                 if reply == QMessageBox.StandardButton.Yes:
                     # Execute command in terminal
-                    success, stdout, stderr = execute_in_terminal_macos(snippet.command_text)
-
-                    if success:
-                        self.snippet_manager.record_usage(snippet_id)
-                        self.load_snippets()  # Refresh to update last_used
-                        self.show_status_message(f"Command executed: {snippet.name}")
-                    else:
+                    try:
+                        execute_in_terminal_macos(snippet.command_text)
+                    except Exception as e:
                         QMessageBox.warning(
                             self,
                             "Execution Error",
-                            f"Failed to execute command:\n{stderr}"
+                            f"Failed to execute command:\n{e}"
                         )
+                    else:
+                        self.snippet_manager.record_usage(snippet_id)
+                        self.load_snippets()  # Refresh to update last_used
+                        self.show_status_message(f"Command executed: {snippet.name}")
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to execute command: {e}")
 
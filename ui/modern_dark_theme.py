@@ -107,7 +107,7 @@ class ModernDarkTheme:
         }}
 
         /* Text Areas */
-        QTextEdit {{
+        QTextEdit, QPlainTextEdit {{
             background-color: {ModernDarkTheme.COLORS['surface']};
             border: 1px solid {ModernDarkTheme.COLORS['border']};
             border-radius: 6px;
@@ -118,21 +118,21 @@ class ModernDarkTheme:
             selection-background-color: {ModernDarkTheme.COLORS['selection']};
         }}
 
-        QTextEdit:focus {{
+        QTextEdit:focus, QPlainTextEdit:focus {{
             border-color: {ModernDarkTheme.COLORS['border_focus']};
             background-color: {ModernDarkTheme.COLORS['surface_elevated']};
         }}
 
         /* Command preview specific overrides to ensure selection is highly visible */
-        QTextEdit#command_edit {{
+        QPlainTextEdit#command_edit {{
             background-color: {ModernDarkTheme.COLORS['surface']};
             color: {ModernDarkTheme.COLORS['text_primary']};
             selection-background-color: #3399ff66; /* semi-transparent bright blue */
             selection-color: {ModernDarkTheme.COLORS['text_primary']};
         }}
 
-        /* The internal viewport of QTextEdit can mask selection on some platforms; make it explicit */
-        QTextEdit#command_edit QWidget {{
+        /* The internal viewport of the text area can mask selection on some platforms; make it explicit */
+        QPlainTextEdit#command_edit QWidget {{
             background: transparent;
         }}
 
@@ -461,7 +461,7 @@ class ModernDarkTheme:
             selection-background-color: {ModernDarkTheme.COLORS['accent_blue']};
             selection-color: {ModernDarkTheme.COLORS['text_primary']};
         }}
-        QTextEdit#description_edit, QTextEdit#command_edit {{
+        QPlainTextEdit#description_edit, QPlainTextEdit#command_edit {{
             selection-background-color: {ModernDarkTheme.COLORS['accent_blue']};
             selection-color: {ModernDarkTheme.COLORS['text_primary']};
         }}
@@ -476,50 +476,102 @@ class ModernDarkTheme:
         }}
         /* Make focus border for dialog inputs more visible and consistent */
         QLineEdit#name_edit:focus, QLineEdit#tags_edit:focus,
-        QTextEdit#description_edit:focus, QTextEdit#command_edit:focus {{
+        QPlainTextEdit#description_edit:focus, QPlainTextEdit#command_edit:focus {{
             border: 2px solid {ModernDarkTheme.COLORS['border_focus']};
             background-color: {ModernDarkTheme.COLORS['surface_elevated']};
         }}
 
-        /* Ensure QTextEdit internal viewport is transparent so borders are visible */
-        QTextEdit#description_edit QWidget, QTextEdit#command_edit QWidget {{
+        /* Ensure QPlainTextEdit internal viewport is transparent so borders are visible */
+        QPlainTextEdit#description_edit QWidget, QPlainTextEdit#command_edit QWidget {{
             background: transparent;
         }}
 
         /* Increase specificity for selection and focus so it applies uniformly */
-        QDialog QLineEdit, QDialog QTextEdit {{
+        QDialog QLineEdit, QDialog QTextEdit, QDialog QPlainTextEdit {{
             selection-background-color: {ModernDarkTheme.COLORS['selection']};
             selection-color: {ModernDarkTheme.COLORS['text_primary']};
         }}
 
-        /* Property-based focused selectors for deterministic visuals */
-        QLineEdit[focused="true"], QTextEdit[focused="true"] {{
-            border: 2px solid {ModernDarkTheme.COLORS['border_focus']};
-            background-color: {ModernDarkTheme.COLORS['surface_elevated']};
+        /* SnippetDialog header and required-fields note */
+        QLabel#dialogHeader {{
+            color: {ModernDarkTheme.COLORS['text_primary']};
+            margin-bottom: 8px;
+        }}
+        QLabel#requiredNote {{
+            color: {ModernDarkTheme.COLORS['text_muted']};
+            font-style: italic;
+            font-size: 11px;
         }}
         """
 
     @staticmethod
-    def create_tag_badge_style(color: str):
+    def create_tag_badge_style(color: str, selector: str = 'QLabel'):
         """Create a badge style for tags."""
         # Use theme primary text color for label text to ensure contrast on dark backgrounds
         text_col = ModernDarkTheme.COLORS['text_primary']
         return f"""
-            QLabel {{
+            {selector} {{
                 background-color: {color}33; /* subtle translucent fill */
                 color: {text_col};
                 border: 1px solid {color}66;
                 border-radius: 8px;
                 padding: 2px 8px;
-                font-size: 12px;
-                font-weight: 500;
+                /* font and width limits are set by TagBadgeWidget */
                 margin: 2px 0px;
                 min-height: 18px;
-                min-width: 28px;
-                max-width: 160px;
             }}
         """
 
+    @staticmethod
+    def get_widget_styles():
+        """Get styles for the custom widgets in `ui.modern_widgets`.
+
+        Widgets are matched by object name (and dynamic properties) so the
+        rules are parsed once as part of the application stylesheet instead
+        of per widget instance.
+        """
+        badge_styles = "".join(
+            ModernDarkTheme.create_tag_badge_style(color, f"QLabel#tagBadge_{idx}")
+            for idx, color in enumerate(ModernDarkTheme.get_tag_colors())
+        )
+        return badge_styles + f"""
+        /* Modern frame and separator */
+        QFrame#modernFrame {{
+            background-color: {ModernDarkTheme.COLORS['surface']};
+            border: 1px solid {ModernDarkTheme.COLORS['border']};
+            border-radius: 8px;
+            padding: 12px;
+        }}
+
+        QFrame#modernSeparator {{
+            background-color: {ModernDarkTheme.COLORS['border']};
+            border: none;
+        }}
+
+        /* Status indicator dot, colored by its `status` property */
+        QLabel#statusIndicator {{
+            border-radius: 4px;
+            background-color: {ModernDarkTheme.COLORS['text_muted']};
+        }}
+        QLabel#statusIndicator[status="success"] {{
+            background-color: {ModernDarkTheme.COLORS['success']};
+        }}
+        QLabel#statusIndicator[status="warning"] {{
+            background-color: {ModernDarkTheme.COLORS['warning']};
+        }}
+        QLabel#statusIndicator[status="error"] {{
+            background-color: {ModernDarkTheme.COLORS['error']};
+        }}
+        QLabel#statusIndicator[status="info"] {{
+            background-color: {ModernDarkTheme.COLORS['info']};
+        }}
+
+        /* Snippet card view */
+        QLabel#cardDescription {{
+            color: {ModernDarkTheme.COLORS['text_muted']};
+        }}
+        """
+
     @staticmethod
     def get_tag_colors():
         """Get predefined colors for tag badges."""
@@ -3,105 +3,111 @@ Custom widgets for modern UI components.
 """
 
 from PyQt6.QtWidgets import QWidget, QHBoxLayout, QLabel, QFrame, QVBoxLayout, QSizePolicy
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QSize
 from PyQt6.QtGui import QFont, QFontMetrics
 from ui.modern_dark_theme import ModernDarkTheme
+from functools import lru_cache
 import hashlib
+import re
 
 
 class TagBadgeWidget(QWidget):
     """A widget that displays tags as modern badges."""
 
+    # Size reported before any tags are set; the height is fixed
+    _CACHED_SIZE = QSize(-1, 24)
+    # Horizontal padding + border on each side of a badge (see create_tag_badge_style)
+    _BADGE_H_PADDING = 9
+    _BADGE_MIN_WIDTH = 36
+    _BADGE_MAX_WIDTH = 140
+    _BADGE_ELIDE_WIDTH = 120
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.layout = QHBoxLayout(self)
         self.layout.setContentsMargins(0, 0, 0, 0)
         self.layout.setSpacing(6)
         self.tag_colors = ModernDarkTheme.get_tag_colors()
+        self._cached_size = self._CACHED_SIZE
+        # Font and metrics shared by every badge in this widget
+        self._badge_font = QFont()
+        self._badge_font.setPointSize(10)
+        self._badge_font.setWeight(QFont.Weight.Medium)
+        self._badge_metrics = QFontMetrics(self._badge_font)
         # Keep the badge container compact and with a fixed height so it
         # doesn't cause some rows to become taller than others.
-        try:
-            self.setFixedHeight(24)
-        except Exception:
-            pass
-        try:
-            from PyQt6.QtWidgets import QSizePolicy
-            # Prefer not to expand horizontally; badges should size to content
-            self.setSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Fixed)
-        except Exception:
-            pass
-        try:
-            # Align badges to the left inside the cell
-            self.layout.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
-        except Exception:
-            pass
+        self.setFixedHeight(24)
+        # Prefer not to expand horizontally; badges should size to content
+        self.setSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Fixed)
+        # Align badges to the left inside the cell
+        self.layout.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
 
     def set_tags(self, tags_string: str):
         """Set the tags to display as badges."""
         # Clear existing tags
         self.clear_tags()
+        self._cached_size = self._CACHED_SIZE
 
         if not tags_string or not tags_string.strip():
+            self.updateGeometry()
             return
 
         # Split tags and create badges
         tags = [tag.strip() for tag in tags_string.split(',') if tag.strip()]
 
+        # Pre-measure the row once so Qt doesn't have to probe every badge.
+        # Measure the (possibly elided) text the badge shows, the same way
+        # QLabel does, so the hint matches the layout.
+        fm = self._badge_metrics
+        width = self.layout.spacing() * (len(tags) - 1)
         for tag in tags:
             badge = self._create_tag_badge(tag)
             self.layout.addWidget(badge)
+            text_width = fm.boundingRect(0, 0, 2000, 2000, 0, badge.text()).width()
+            width += max(self._BADGE_MIN_WIDTH,
+                         min(self._BADGE_MAX_WIDTH, text_width + 2 * self._BADGE_H_PADDING))
         # Do not add stretch inside table cells — keep natural sizing
+        self._cached_size = QSize(width, self._CACHED_SIZE.height())
+        self.updateGeometry()
+
+    def sizeHint(self) -> QSize:
+        """Return the size measured by the last set_tags call."""
+        return self._cached_size
 
     def _create_tag_badge(self, tag: str) -> QLabel:
         """Create a single tag badge."""
         badge = QLabel(tag)
         badge.setAlignment(Qt.AlignmentFlag.AlignCenter)
 
-        # Generate consistent color for tag
-        color = self._get_tag_color(tag)
-
-        # Apply badge styling using centralized theme helper
-        badge.setStyleSheet(ModernDarkTheme.create_tag_badge_style(color))
+        # Badge colors come from the application stylesheet, keyed by the
+        # tag's color index (see ModernDarkTheme.get_widget_styles)
+        badge.setObjectName(f"tagBadge_{self._get_tag_color_index(tag)}")
 
         # Set font
-        font = QFont()
-        font.setPointSize(10)
-        font.setWeight(QFont.Weight.Medium)
-        badge.setFont(font)
+        badge.setFont(self._badge_font)
 
         # Constrain badge height so it doesn't increase table row height and allow it to expand horizontally
-        try:
-            badge.setFixedHeight(20)
-        except Exception:
-            pass
-        try:
-            from PyQt6.QtWidgets import QSizePolicy
-            badge.setSizePolicy(QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Fixed)
-            badge.setMinimumWidth(36)
-            badge.setMaximumWidth(140)
-        except Exception:
-            pass
+        badge.setFixedHeight(20)
+        badge.setSizePolicy(QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Fixed)
+        badge.setMinimumWidth(self._BADGE_MIN_WIDTH)
+        badge.setMaximumWidth(self._BADGE_MAX_WIDTH)
 
-        # Elide text if too long to fit the badge
-        try:
-            from PyQt6.QtGui import QFontMetrics
-            fm = QFontMetrics(font)
-            elided = fm.elidedText(tag, Qt.TextElideMode.ElideRight, 120)
-            badge.setText(elided)
-        except Exception:
-            pass
+        # Elide text if too long to fit the badge. Most tags are short, so
+        # only re-set the text (and relayout) when eliding is needed.
+        fm = self._badge_metrics
+        if fm.horizontalAdvance(tag) > self._BADGE_ELIDE_WIDTH:
+            badge.setText(fm.elidedText(tag, Qt.TextElideMode.ElideRight, self._BADGE_ELIDE_WIDTH))
 
         return badge
 
-    def _get_tag_color(self, tag: str) -> str:
-        """Return a single, consistent color for all tags."""
+    def _get_tag_color_index(self, tag: str) -> int:
+        """Return a consistent index into the tag color palette."""
         # Deterministic color selection based on tag hash for better variety
         try:
             h = int(hashlib.sha1(tag.encode('utf-8')).hexdigest(), 16)
-            idx = h % len(self.tag_colors)
-            return self.tag_colors[idx]
+            return h % len(self.tag_colors)
         except Exception:
-            return ModernDarkTheme.COLORS['accent_blue']
+            return 0
 
     def clear_tags(self):
         """Clear all tag badges."""
@@ -116,14 +122,7 @@ class ModernFrame(QFrame):
 
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.setStyleSheet(f"""
-            QFrame {{
-                background-color: {ModernDarkTheme.COLORS['surface']};
-                border: 1px solid {ModernDarkTheme.COLORS['border']};
-                border-radius: 8px;
-                padding: 12px;
-            }}
-        """)
+        self.setObjectName("modernFrame")
 
 
 class ModernSeparator(QFrame):
@@ -131,6 +130,7 @@ class ModernSeparator(QFrame):
 
     def __init__(self, orientation=Qt.Orientation.Horizontal, parent=None):
         super().__init__(parent)
+        self.setObjectName("modernSeparator")
         if orientation == Qt.Orientation.Horizontal:
             self.setFrameShape(QFrame.Shape.HLine)
             self.setFixedHeight(1)
@@ -138,62 +138,58 @@ class ModernSeparator(QFrame):
             self.setFrameShape(QFrame.Shape.VLine)
             self.setFixedWidth(1)
 
-        self.setStyleSheet(f"""
-            QFrame {{
-                background-color: {ModernDarkTheme.COLORS['border']};
-                border: none;
-            }}
-        """)
-
 
 class StatusIndicator(QLabel):
     """A modern status indicator widget."""
 
+    # Statuses with a dedicated color rule in ModernDarkTheme.get_widget_styles
+    STATUSES = ('success', 'warning', 'error', 'info')
+
     def __init__(self, parent=None):
         super().__init__(parent)
+        self.setObjectName("statusIndicator")
         self.setFixedSize(8, 8)
-        self.setStyleSheet(f"""
-            QLabel {{
-                border-radius: 4px;
-                background-color: {ModernDarkTheme.COLORS['text_muted']};
-            }}
-        """)
+        self._status = 'default'
 
     def set_status(self, status: str):
         """Set the status and update color."""
-        colors = {
-            'success': ModernDarkTheme.COLORS['success'],
-            'warning': ModernDarkTheme.COLORS['warning'],
-            'error': ModernDarkTheme.COLORS['error'],
-            'info': ModernDarkTheme.COLORS['info'],
-            'default': ModernDarkTheme.COLORS['text_muted']
-        }
-
-        color = colors.get(status, colors['default'])
-        self.setStyleSheet(f"""
-            QLabel {{
-                border-radius: 4px;
-                background-color: {color};
-            }}
-        """)
+        if status not in self.STATUSES:
+            status = 'default'
+        if status == self._status:
+            return
+        self._status = status
+        # The color is chosen by the `status` property selectors in the
+        # application stylesheet; re-polish so the new value takes effect.
+        self.setProperty('status', status)
+        self.style().unpolish(self)
+        self.style().polish(self)
+
+
+@lru_cache(maxsize=32)
+def _compile_search_term(term: str):
+    """Return a cached case-insensitive pattern matching `term` literally."""
+    return re.compile(re.escape(term), re.IGNORECASE)
 
 
 class SearchHighlight:
     """Utility class for highlighting search terms in text."""
 
+    # Replacement template; \g<0> keeps the matched text's original casing
+    _HIGHLIGHT_TEMPLATE = (
+        f'<span style="background-color: {ModernDarkTheme.COLORS["warning"]}33; '
+        f'color: {ModernDarkTheme.COLORS["warning"]}; font-weight: bold;">\\g<0></span>'
+    )
+
     @staticmethod
     def highlight_text(text: str, search_term: str) -> str:
-        """Highlight search terms in HTML format."""
-        if not search_term or not text:
+        """Highlight search terms (case-insensitive) in HTML format."""
+        # A term longer than the text can never match. Otherwise let the regex
+        # do the work: sub() returns `text` itself when nothing matches, so a
+        # separate search() pre-check would only rescan matching rows.
+        if not search_term or not text or len(search_term) > len(text):
             return text
 
-        # Simple highlighting - could be enhanced with regex for better matching
-        highlighted = text.replace(
-            search_term,
-            f'<span style="background-color: {ModernDarkTheme.COLORS["warning"]}33; '
-            f'color: {ModernDarkTheme.COLORS["warning"]}; font-weight: bold;">{search_term}</span>'
-        )
-        return highlighted
+        return _compile_search_term(search_term).sub(SearchHighlight._HIGHLIGHT_TEMPLATE, text)
 
 
 class SnippetCard(QFrame):
@@ -219,7 +215,6 @@ class SnippetCard(QFrame):
         desc_font = desc.font()
         desc_font.setPointSize(11)
         desc.setFont(desc_font)
-        desc.setStyleSheet(f"color: {ModernDarkTheme.COLORS['text_muted']};")
 
         tags_widget = TagBadgeWidget()
         tags_widget.set_tags(self.snippet.get('tags', ''))
@@ -232,8 +227,5 @@ class SnippetCard(QFrame):
         layout.addWidget(tags_widget)
 
         # Ensure compact height
-        try:
-            self.setSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Minimum)
-            self.setMinimumHeight(64)
-        except Exception:
-            pass
+        self.setSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Minimum)
+        self.setMinimumHeight(64)
@@ -3,24 +3,97 @@ Dialog for creating and editing command snippets.
 """
 
 from PyQt6.QtWidgets import (
-    QDialog, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit,
-    QTextEdit, QDialogButtonBox, QFormLayout, QMessageBox
+    QDialog, QVBoxLayout, QLabel, QLineEdit, QPlainTextEdit,
+    QDialogButtonBox, QGridLayout, QMessageBox, QGraphicsDropShadowEffect
 )
-from PyQt6.QtCore import Qt, QObject, QEvent
-from PyQt6.QtWidgets import QApplication
+from PyQt6.QtCore import Qt, QObject, QEvent, QTimer, QSignalBlocker
 from PyQt6.QtGui import QFont, QPalette, QColor
-from PyQt6.QtWidgets import QGraphicsDropShadowEffect
 from db.models import Snippet
 from ui.modern_dark_theme import ModernDarkTheme
 from ui.modern_widgets import ModernFrame
+from utils.logger import LOGS_DIR
 from typing import Optional, Dict
+from functools import lru_cache
 import logging
 import os
+from collections import deque
 from datetime import datetime
 
 # Module logger
 logger = logging.getLogger(__name__)
 
+# Persistent log of focus/click events for user inspection, next to the app
+# log (so CSM_LOG_DIR moves it too)
+_INTERACTION_LOG = os.path.join(LOGS_DIR, 'interaction_events.log')
+# How often buffered interaction events are appended to _INTERACTION_LOG
+_INTERACTION_FLUSH_MS = 2000
+
+# Ctrl+Enter saves; enum members looked up once instead of on every keypress
+_SAVE_MODIFIER = Qt.KeyboardModifier.ControlModifier
+_SAVE_KEY = Qt.Key.Key_Return
+
+# Semi-transparent focus color for the input drop shadow (QColor is copied
+# by setColor, so one shared instance is safe)
+_FOCUS_SHADOW_COLOR = QColor(ModernDarkTheme.COLORS['border_focus'])
+_FOCUS_SHADOW_COLOR.setAlpha(140)
+
+# Inline style applied to the focused input by _apply_inline_focus_style; the
+# style it replaces is kept in a dynamic property on the input until focus-out
+_ORIG_STYLE_PROPERTY = 'origInlineStyle'
+_INLINE_FOCUS_QSS = (f"border: 2px solid {ModernDarkTheme.COLORS['border_focus']}; "
+                     f"background-color: {ModernDarkTheme.COLORS['surface_elevated']};")
+
+
+@lru_cache(maxsize=None)
+def _dialog_fonts():
+    """Return the (label, header, monospace) fonts shared by every dialog.
+
+    Built on the first dialog build rather than at import, so importing the
+    module doesn't touch the font database. setFont copies, so sharing is safe.
+    """
+    return (QFont("", 12, QFont.Weight.Medium),
+            QFont("", 18, QFont.Weight.Bold),
+            QFont("SF Mono, Monaco, Cascadia Code, Roboto Mono", 12))
+
+
+@lru_cache(maxsize=None)
+def _dialog_stylesheet() -> str:
+    """Return the dialog-scoped stylesheet, built once from the theme palette.
+
+    Every input gets an explicit background here, so nothing relies on palette
+    fills. Strict QPlainTextEdit rules keep the focus border in line with
+    QLineEdit. Field labels and the Save/Cancel buttons are styled by object
+    name, so the whole dialog is polished by a single setStyleSheet call.
+    """
+    button_styles = ModernDarkTheme.get_button_styles()
+    return f"""
+        QLabel#fieldLabel {{
+            color: {ModernDarkTheme.COLORS['text_primary']};
+        }}
+        QLineEdit#name_edit, QLineEdit#tags_edit {{
+            background-color: {ModernDarkTheme.COLORS['surface']};
+        }}
+        QLineEdit#name_edit:hover, QLineEdit#tags_edit:hover,
+        QLineEdit#name_edit:focus, QLineEdit#tags_edit:focus {{
+            background-color: {ModernDarkTheme.COLORS['surface_elevated']};
+        }}
+        QPlainTextEdit#description_edit, QPlainTextEdit#command_edit {{
+            background-color: {ModernDarkTheme.COLORS['surface']};
+            border: 1px solid {ModernDarkTheme.COLORS['border']};
+            border-radius: 6px;
+            padding: 8px;
+            color: {ModernDarkTheme.COLORS['text_primary']};
+        }}
+        QPlainTextEdit#description_edit:focus, QPlainTextEdit#command_edit:focus {{
+            border: 2px solid {ModernDarkTheme.COLORS['border_focus']};
+            background-color: {ModernDarkTheme.COLORS['surface_elevated']};
+        }}
+        QPlainTextEdit#description_edit QWidget, QPlainTextEdit#command_edit QWidget {{
+            background: transparent;
+        }}
+    """ + (button_styles['primary'].replace('QPushButton', 'QPushButton#saveButton')
+           + button_styles['secondary'].replace('QPushButton', 'QPushButton#cancelButton'))
+
 
 class SnippetDialog(QDialog):
     """
@@ -40,52 +113,56 @@ class SnippetDialog(QDialog):
             self.snippet = snippet
             self.is_editing = snippet is not None
 
-            self._setup_ui()
-            self._populate_fields()
-            self._connect_signals()
-            logging.debug("SnippetDialog: initialized UI, connecting focus logger")
+            # Only cheap window properties are set here; the widget tree is
+            # built on first show (see showEvent) so dialogs that are created
+            # but never displayed don't pay for it.
+            self._ui_built = False
+            self.setWindowTitle("✨ Edit Snippet" if self.is_editing else "✨ New Snippet")
+            self.setModal(True)
+            self.resize(650, 500)
+        except Exception:
+            logger.exception("Failed to initialize SnippetDialog")
+            raise
+
+    def showEvent(self, event):
+        """Build the dialog contents the first time the dialog is shown."""
+        self._ensure_ui()
+        super().showEvent(event)
+
+    def _ensure_ui(self):
+        """Build widgets, populate fields and connect signals once."""
+        if self._ui_built:
+            return
+        self._ui_built = True
+        try:
+            # Hold off repaints while the widget tree is built and filled in so
+            # the dialog is painted once, when it is first shown.
+            self.setUpdatesEnabled(False)
+            try:
+                self._setup_ui()
+                self._connect_signals()
+                self._populate_fields()
+            finally:
+                self.setUpdatesEnabled(True)
+            logger.debug("SnippetDialog: initialized UI")
             # Selection styling and any advanced focus visuals are handled
             # centrally in `ModernDarkTheme`. Avoid applying dialog-scoped
             # palettes or graphical effects here to keep the dialog simple.
-            try:
-                app = QApplication.instance()
-                if app:
-                    app.focusChanged.connect(self._on_focus_changed)
-                    logging.debug("SnippetDialog: connected to QApplication.focusChanged")
-            except Exception as e:
-                logging.exception("SnippetDialog: failed to connect focusChanged: %s", e)
-            # Run initial diagnostics on all editable fields
-            try:
-                logging.debug("SnippetDialog: running initial diagnostics for inputs")
-                try:
-                    self._diagnose(self.name_edit, 'name_edit_init')
-                except Exception:
-                    logging.exception("SnippetDialog: diagnose name_edit failed")
-                try:
-                    self._diagnose(self.description_edit, 'description_edit_init')
-                except Exception:
-                    logging.exception("SnippetDialog: diagnose description_edit failed")
-                try:
-                    self._diagnose(self.command_edit, 'command_edit_init')
-                except Exception:
-                    logging.exception("SnippetDialog: diagnose command_edit failed")
-                try:
-                    self._diagnose(self.tags_edit, 'tags_edit_init')
-                except Exception:
-                    logging.exception("SnippetDialog: diagnose tags_edit failed")
-            except Exception:
-                logging.exception("SnippetDialog: initial diagnostics failed")
+            # Initial diagnostics on all editable fields are only worth their
+            # palette/attribute probes when debug logging is on.
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("SnippetDialog: running initial diagnostics for inputs")
+                self._diagnose(self.name_edit, 'name_edit_init')
+                self._diagnose(self.description_edit, 'description_edit_init')
+                self._diagnose(self.command_edit, 'command_edit_init')
+                self._diagnose(self.tags_edit, 'tags_edit_init')
         except Exception:
-            logging.exception("Failed to initialize SnippetDialog")
+            logger.exception("Failed to build SnippetDialog UI")
             raise
 
     def _setup_ui(self):
         """Set up the user interface elements."""
-        # Set dialog properties
-        title = "✨ Edit Snippet" if self.is_editing else "✨ New Snippet"
-        self.setWindowTitle(title)
-        self.setModal(True)
-        self.resize(650, 500)
+        label_font, header_font, mono_font = _dialog_fonts()
 
         # Main layout with improved spacing
         layout = QVBoxLayout(self)
@@ -93,9 +170,9 @@ class SnippetDialog(QDialog):
         layout.setContentsMargins(24, 24, 24, 24)
 
         # Header
-        header_label = QLabel(title)
-        header_label.setFont(QFont("", 18, QFont.Weight.Bold))
-        header_label.setStyleSheet(f"color: {ModernDarkTheme.COLORS['text_primary']}; margin-bottom: 8px;")
+        header_label = QLabel(self.windowTitle())
+        header_label.setFont(header_font)
+        header_label.setObjectName('dialogHeader')
         layout.addWidget(header_label)
 
         # Content frame
@@ -104,124 +181,84 @@ class SnippetDialog(QDialog):
         content_layout.setSpacing(16)
         content_layout.setContentsMargins(20, 20, 20, 20)
 
-        # Form layout for input fields
-        form_layout = QFormLayout()
+        # Fixed two-column grid for the input fields: labels in column 0,
+        # inputs in column 1. Single-line rows center their label; multi-line
+        # rows keep it at the top, as a form layout would.
+        form_layout = QGridLayout()
         form_layout.setVerticalSpacing(12)
         form_layout.setHorizontalSpacing(12)
+        form_layout.setColumnStretch(1, 1)
+        line_label_align = Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter
+        text_label_align = Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop
 
         # Name field
         name_label = QLabel("Name *")
-        name_label.setFont(QFont("", 12, QFont.Weight.Medium))
-        name_label.setStyleSheet(f"color: {ModernDarkTheme.COLORS['text_primary']};")
+        name_label.setFont(label_font)
+        name_label.setObjectName('fieldLabel')
 
         self.name_edit = QLineEdit()
         self.name_edit.setObjectName('name_edit')
-        self.name_edit.setAutoFillBackground(True)
         self.name_edit.setPlaceholderText("Enter a short, descriptive name...")
         self.name_edit.setMinimumHeight(36)
-        try:
-            self.name_edit.setAttribute(Qt.WidgetAttribute.WA_MacShowFocusRect, False)
-            logging.debug("SnippetDialog: name_edit WA_MacShowFocusRect disabled")
-        except Exception:
-            logging.exception("SnippetDialog: failed to set WA_MacShowFocusRect on name_edit")
-        form_layout.addRow(name_label, self.name_edit)
+        self.name_edit.setAttribute(Qt.WidgetAttribute.WA_MacShowFocusRect, False)
+        form_layout.addWidget(name_label, 0, 0, line_label_align)
+        form_layout.addWidget(self.name_edit, 0, 1)
 
         # Description field
         desc_label = QLabel("Description")
-        desc_label.setFont(QFont("", 12, QFont.Weight.Medium))
-        desc_label.setStyleSheet(f"color: {ModernDarkTheme.COLORS['text_primary']};")
+        desc_label.setFont(label_font)
+        desc_label.setObjectName('fieldLabel')
 
-        self.description_edit = QTextEdit()
+        self.description_edit = QPlainTextEdit()
         self.description_edit.setObjectName('description_edit')
-        self.description_edit.setAutoFillBackground(True)
         self.description_edit.setPlaceholderText("Enter a longer description of what this command does...")
         self.description_edit.setMaximumHeight(100)
         self.description_edit.setMinimumHeight(80)
         self.description_edit.setTextInteractionFlags(Qt.TextInteractionFlag.TextEditorInteraction)
-        try:
-            self.description_edit.setAttribute(Qt.WidgetAttribute.WA_MacShowFocusRect, False)
-            logging.debug("SnippetDialog: description_edit WA_MacShowFocusRect disabled")
-            # also ensure the viewport does not show native focus
-            try:
-                self.description_edit.viewport().setAttribute(Qt.WidgetAttribute.WA_MacShowFocusRect, False)
-                logging.debug("SnippetDialog: description_edit.viewport WA_MacShowFocusRect disabled")
-            except Exception as e:
-                logging.exception("SnippetDialog: failed to set WA_MacShowFocusRect on description_edit.viewport: %s", e)
-        except Exception:
-            logging.exception("SnippetDialog: failed to set WA_MacShowFocusRect on description_edit: %s", exc_info=True)
-        form_layout.addRow(desc_label, self.description_edit)
+        self.description_edit.setAttribute(Qt.WidgetAttribute.WA_MacShowFocusRect, False)
+        # also ensure the viewport does not show native focus
+        self.description_edit.viewport().setAttribute(Qt.WidgetAttribute.WA_MacShowFocusRect, False)
+        form_layout.addWidget(desc_label, 1, 0, text_label_align)
+        form_layout.addWidget(self.description_edit, 1, 1)
 
         # Command text field
         command_label = QLabel("Command *")
-        command_label.setFont(QFont("", 12, QFont.Weight.Medium))
-        command_label.setStyleSheet(f"color: {ModernDarkTheme.COLORS['text_primary']};")
+        command_label.setFont(label_font)
+        command_label.setObjectName('fieldLabel')
 
-        self.command_edit = QTextEdit()
+        self.command_edit = QPlainTextEdit()
         self.command_edit.setObjectName('command_edit')
-        self.command_edit.setAutoFillBackground(True)
         self.command_edit.setPlaceholderText("Enter the command to execute...")
         self.command_edit.setMinimumHeight(140)
-        self.command_edit.setFont(QFont("SF Mono, Monaco, Cascadia Code, Roboto Mono", 12))
+        self.command_edit.setFont(mono_font)
+        # Commands are mostly long single lines; skip re-wrapping on every
+        # keystroke and resize and let them scroll horizontally instead
+        self.command_edit.setLineWrapMode(QPlainTextEdit.LineWrapMode.NoWrap)
         self.command_edit.setTextInteractionFlags(Qt.TextInteractionFlag.TextEditorInteraction)
-        try:
-            self.command_edit.setAttribute(Qt.WidgetAttribute.WA_MacShowFocusRect, False)
-            logging.debug("SnippetDialog: command_edit WA_MacShowFocusRect disabled")
-            try:
-                self.command_edit.viewport().setAttribute(Qt.WidgetAttribute.WA_MacShowFocusRect, False)
-                logging.debug("SnippetDialog: command_edit.viewport WA_MacShowFocusRect disabled")
-            except Exception as e:
-                logging.exception("SnippetDialog: failed to set WA_MacShowFocusRect on command_edit.viewport: %s", e)
-        except Exception:
-            logging.exception("SnippetDialog: failed to set WA_MacShowFocusRect on command_edit: %s", exc_info=True)
-        form_layout.addRow(command_label, self.command_edit)
-
-        # Apply strict inline style to QTextEdit so focus border matches QLineEdit
-        try:
-            fq = ModernDarkTheme.COLORS
-            textarea_style = f"""
-                QTextEdit#description_edit, QTextEdit#command_edit {{
-                    background-color: {fq['surface']};
-                    border: 1px solid {fq['border']};
-                    border-radius: 6px;
-                    padding: 8px;
-                    color: {fq['text_primary']};
-                }}
-                QTextEdit#description_edit:focus, QTextEdit#command_edit:focus {{
-                    border: 2px solid {fq['border_focus']};
-                    background-color: {fq['surface_elevated']};
-                }}
-                QTextEdit#description_edit QWidget, QTextEdit#command_edit QWidget {{
-                    background: transparent;
-                }}
-            """
-            current = self.styleSheet() or ""
-            self.setStyleSheet(current + textarea_style)
-        except Exception:
-            pass
+        self.command_edit.setAttribute(Qt.WidgetAttribute.WA_MacShowFocusRect, False)
+        self.command_edit.viewport().setAttribute(Qt.WidgetAttribute.WA_MacShowFocusRect, False)
+        form_layout.addWidget(command_label, 2, 0, text_label_align)
+        form_layout.addWidget(self.command_edit, 2, 1)
 
         # Tags field
         tags_label = QLabel("Tags")
-        tags_label.setFont(QFont("", 12, QFont.Weight.Medium))
-        tags_label.setStyleSheet(f"color: {ModernDarkTheme.COLORS['text_primary']};")
+        tags_label.setFont(label_font)
+        tags_label.setObjectName('fieldLabel')
 
         self.tags_edit = QLineEdit()
         self.tags_edit.setObjectName('tags_edit')
-        self.tags_edit.setAutoFillBackground(True)
         self.tags_edit.setPlaceholderText("Enter comma-separated tags (e.g., aws, docker, ssh)...")
         self.tags_edit.setMinimumHeight(36)
-        try:
-            self.tags_edit.setAttribute(Qt.WidgetAttribute.WA_MacShowFocusRect, False)
-            logging.debug("SnippetDialog: tags_edit WA_MacShowFocusRect disabled")
-        except Exception:
-            logging.exception("SnippetDialog: failed to set WA_MacShowFocusRect on tags_edit")
-        form_layout.addRow(tags_label, self.tags_edit)
+        self.tags_edit.setAttribute(Qt.WidgetAttribute.WA_MacShowFocusRect, False)
+        form_layout.addWidget(tags_label, 3, 0, line_label_align)
+        form_layout.addWidget(self.tags_edit, 3, 1)
 
         content_layout.addLayout(form_layout)
         layout.addWidget(content_frame)
 
         # Required fields note
         required_label = QLabel("* Required fields")
-        required_label.setStyleSheet(f"color: {ModernDarkTheme.COLORS['text_muted']}; font-style: italic; font-size: 11px;")
+        required_label.setObjectName('requiredNote')
         layout.addWidget(required_label)
 
         # Dialog buttons with modern styling
@@ -229,18 +266,19 @@ class SnippetDialog(QDialog):
             QDialogButtonBox.StandardButton.Save | QDialogButtonBox.StandardButton.Cancel
         )
 
-        # Apply modern button styles
-        button_styles = ModernDarkTheme.get_button_styles()
+        # Modern button styles come from _dialog_stylesheet via the object names
         save_button = self.button_box.button(QDialogButtonBox.StandardButton.Save)
+        # Kept for _update_save_button, which runs as the user types
+        self._save_button = save_button
         cancel_button = self.button_box.button(QDialogButtonBox.StandardButton.Cancel)
 
         if save_button:
-            save_button.setStyleSheet(button_styles['primary'])
+            save_button.setObjectName('saveButton')
             save_button.setMinimumHeight(36)
             save_button.setText("💾 Save")
 
         if cancel_button:
-            cancel_button.setStyleSheet(button_styles['secondary'])
+            cancel_button.setObjectName('cancelButton')
             cancel_button.setMinimumHeight(36)
             cancel_button.setText("❌ Cancel")
 
@@ -249,17 +287,39 @@ class SnippetDialog(QDialog):
         # Set focus to name field
         self.name_edit.setFocus()
 
-        # Storage for original inline styles when we apply programmatic focus styling
-        try:
-            self._orig_inline_styles = {}
-        except Exception:
-            self._orig_inline_styles = {}
-
-        # Install event filter to capture focus and click events for diagnostics
+        # Install event filter to capture focus and click events: drives the
+        # focus visuals and clears selections when an input loses focus
         class _InputEventFilter(QObject):
-            def __init__(self, parent=None, targets=None):
+            # The only event types the filter handles, mapped to their log names
+            _EVENT_NAMES = {
+                QEvent.Type.FocusIn: 'FocusIn',
+                QEvent.Type.FocusOut: 'FocusOut',
+                QEvent.Type.MouseButtonPress: 'MouseButtonPress',
+            }
+
+            def __init__(self, parent=None):
                 super().__init__(parent)
-                self._targets = set(targets or [])
+                # Events are buffered and appended to the interaction log in
+                # one write per interval instead of opening the file per event
+                self._event_queue = deque(maxlen=4096)
+                self._flush_timer = QTimer(self)
+                self._flush_timer.setSingleShot(True)
+                self._flush_timer.setInterval(_INTERACTION_FLUSH_MS)
+                self._flush_timer.timeout.connect(self.flush)
+
+            def flush(self):
+                """Append buffered interaction events to the log file."""
+                if not self._event_queue:
+                    return
+                lines = [f"{ts.isoformat()}Z\t{ev_name}\t{nm}\n" for ts, ev_name, nm in self._event_queue]
+                self._event_queue.clear()
+                try:
+                    # The logs directory only exists once something is written
+                    os.makedirs(LOGS_DIR, exist_ok=True)
+                    with open(_INTERACTION_LOG, 'a', encoding='utf-8') as fh:
+                        fh.writelines(lines)
+                except Exception:
+                    logger.exception("SnippetDialog: failed to write interaction events to file")
 
             def _safe_name(self, obj):
                 try:
@@ -273,225 +333,129 @@ class SnippetDialog(QDialog):
                     return '<unknown>'
 
             def eventFilter(self, obj, event):
+                # Most events (paint, move, timer...) are of no interest. The
+                # filter is only installed on the inputs and their viewports,
+                # so every obj seen here is one of them.
+                ev_name = self._EVENT_NAMES.get(event.type())
+                if ev_name is None:
+                    return False
                 try:
-                    et = event.type()
-                    ev_name = None
-                    if et == QEvent.Type.FocusIn:
-                        ev_name = 'FocusIn'
-                    elif et == QEvent.Type.FocusOut:
-                        ev_name = 'FocusOut'
-                    elif et == QEvent.Type.MouseButtonPress:
-                        ev_name = 'MouseButtonPress'
-                    if ev_name:
-                        nm = self._safe_name(obj)
-                        logger.info("SnippetDialog.event: %s on %s", ev_name, nm)
-                        # Also append to a persistent log file for user inspection
-                        try:
-                            proj_root = os.path.dirname(os.path.dirname(__file__))
-                            lf = os.path.join(proj_root, 'logs', 'interaction_events.log')
-                            with open(lf, 'a', encoding='utf-8') as fh:
-                                fh.write(f"{datetime.utcnow().isoformat()}Z\t{ev_name}\t{nm}\n")
-                        except Exception:
-                            logger.exception("SnippetDialog: failed to write interaction event to file")
-                        # If focus changed, set a property so CSS can show a deterministic focus style
-                        try:
-                            if ev_name in ('FocusIn', 'FocusOut'):
-                                focused_val = (ev_name == 'FocusIn')
-                                # Set property on the object itself
-                                try:
-                                    obj.setProperty('focused', focused_val)
-                                except Exception:
-                                    pass
-                                # Also attempt to set the property on the parent (covers QTextEdit.viewport and similar)
-                                try:
-                                    parent = None
-                                    if hasattr(obj, 'parent'):
-                                        try:
-                                            parent = obj.parent()
-                                        except Exception:
-                                            parent = getattr(obj, 'parent', lambda: None)()
-                                    if parent is not None:
-                                        try:
-                                            parent.setProperty('focused', focused_val)
-                                        except Exception:
-                                            pass
-                                except Exception:
-                                    pass
-                                # force style update on both
-                                try:
-                                    for tgt in (obj, parent):
-                                        if tgt is None:
-                                            continue
-                                        try:
-                                            tgt.style().unpolish(tgt)
-                                            tgt.style().polish(tgt)
-                                            tgt.update()
-                                        except Exception:
-                                            pass
-                                except Exception:
-                                    pass
-                                # Apply or remove inline focus stylesheet to guarantee visuals
-                                try:
-                                    dlg = self.parent()
-                                    if dlg is not None:
-                                        try:
-                                            # Determine the real input widget to style.
-                                            real_tgt = None
-                                            # If the event is on the widget itself (QLineEdit/QTextEdit), use it
-                                            try:
-                                                from PyQt6.QtWidgets import QLineEdit, QTextEdit
-                                                if isinstance(obj, (QLineEdit, QTextEdit)):
-                                                    real_tgt = obj
-                                                else:
-                                                    # If event is on a viewport child, prefer its parent if it's a text input
-                                                    p = None
-                                                    try:
-                                                        p = obj.parent()
-                                                    except Exception:
-                                                        p = getattr(obj, 'parent', lambda: None)()
-                                                    if isinstance(p, (QLineEdit, QTextEdit)):
-                                                        real_tgt = p
-                                            except Exception:
-                                                real_tgt = None
-
-                                            # Only apply styling to recognized input widgets
-                                            if real_tgt is not None:
-                                                if focused_val:
-                                                    if hasattr(dlg, '_apply_inline_focus_style'):
-                                                        dlg._apply_inline_focus_style(real_tgt)
-                                                else:
-                                                    if hasattr(dlg, '_remove_inline_focus_style'):
-                                                        dlg._remove_inline_focus_style(real_tgt)
-                                        except Exception:
-                                            pass
-                                except Exception:
-                                    pass
-                        except Exception:
-                            logger.exception("SnippetDialog: failed to set focused property")
+                    nm = self._safe_name(obj)
+                    logger.info("SnippetDialog.event: %s on %s", ev_name, nm)
+                    # Also queue for the persistent log file (see flush)
+                    self._event_queue.append((datetime.utcnow(), ev_name, nm))
+                    if not self._flush_timer.isActive():
+                        self._flush_timer.start()
+                    # Focus borders come from the :focus selectors; the inline
+                    # focus style and shadow are applied to the input itself
+                    # (or the input owning a viewport that saw the event).
+                    if ev_name in ('FocusIn', 'FocusOut'):
+                        real_tgt = obj
+                        if not isinstance(real_tgt, (QLineEdit, QPlainTextEdit)):
+                            real_tgt = obj.parent()
+                        dlg = self.parent()
+                        # The parent is a plain QDialog while it is being destroyed
+                        if isinstance(real_tgt, (QLineEdit, QPlainTextEdit)) and isinstance(dlg, SnippetDialog):
+                            if ev_name == 'FocusIn':
+                                dlg._apply_inline_focus_style(real_tgt)
+                            else:
+                                dlg._remove_inline_focus_style(real_tgt)
+                                dlg._clear_selection(real_tgt)
                 except Exception:
                     logger.exception("SnippetDialog.eventFilter error")
                 return False
 
         try:
             targets = [self.name_edit, self.description_edit, self.command_edit, self.tags_edit]
-            self._input_event_filter = _InputEventFilter(parent=self, targets=targets)
-            # Install on each widget and their viewports (for QTextEdit)
+            self._input_event_filter = _InputEventFilter(parent=self)
+            # Install on each widget and their viewports (for QPlainTextEdit)
             for w in targets:
-                try:
-                    w.installEventFilter(self._input_event_filter)
-                except Exception:
-                    logger.exception("SnippetDialog: failed to install eventFilter on %s", getattr(w, 'objectName', lambda: '')())
-                # also install on viewport for QTextEdit
-                try:
-                    if hasattr(w, 'viewport'):
-                        w.viewport().installEventFilter(self._input_event_filter)
-                except Exception:
-                    logger.exception("SnippetDialog: failed to install eventFilter on viewport for %s", getattr(w, 'objectName', lambda: '')())
-            # Also install on the dialog itself to capture child events as a fallback
-            try:
-                self.installEventFilter(self._input_event_filter)
-            except Exception:
-                logger.exception("SnippetDialog: failed to install eventFilter on dialog")
+                w.installEventFilter(self._input_event_filter)
+                # also install on viewport for QPlainTextEdit
+                if hasattr(w, 'viewport'):
+                    w.viewport().installEventFilter(self._input_event_filter)
+            # Write out anything still buffered once the dialog is dismissed
+            self.finished.connect(self._input_event_filter.flush)
         except Exception:
-            logging.exception("SnippetDialog: failed to create/install input event filter")
+            logger.exception("SnippetDialog: failed to create/install input event filter")
+
+        # Apply the dialog stylesheet exactly once, after all children exist,
+        # so Qt runs a single polish pass over the dialog subtree.
+        self.setStyleSheet(_dialog_stylesheet())
 
-        # Dialog relies on centralized theme for input visuals; avoid
-        # injecting additional unified styles here.
-        # Log current dialog stylesheet length for debugging
-        try:
-            ss = (self.styleSheet() or "")
-            logging.debug("SnippetDialog: current combined stylesheet length=%d", len(ss))
-        except Exception:
-            logging.exception("SnippetDialog: failed to read stylesheet for logging")
     def _apply_inline_focus_style(self, widget):
         """Apply an inline stylesheet to `widget` to guarantee focus visuals."""
         try:
             if widget is None:
                 return
-            key = id(widget)
-            # Save original inline style if not already saved
-            if key not in self._orig_inline_styles:
-                try:
-                    self._orig_inline_styles[key] = widget.styleSheet() or ''
-                except Exception:
-                    self._orig_inline_styles[key] = ''
-
-            fq = ModernDarkTheme.COLORS
-            inline = f"border: 2px solid {fq['border_focus']}; background-color: {fq['surface_elevated']};"
-            # Merge with existing inline style if present
-            try:
-                widget.setStyleSheet(inline)
-            except Exception:
-                logging.exception("SnippetDialog: failed to set inline focus style on %s", getattr(widget, 'objectName', lambda: '')())
-            # Additionally apply a subtle drop shadow for robustness across platforms
-            try:
-                # Subtle shadow: smaller blur, no vertical offset, semi-transparent color
+            # Save the original inline style on the widget itself, unless a
+            # previous focus-in already did
+            if widget.property(_ORIG_STYLE_PROPERTY) is None:
+                widget.setProperty(_ORIG_STYLE_PROPERTY, widget.styleSheet() or '')
+
+            widget.setStyleSheet(_INLINE_FOCUS_QSS)
+            # Additionally apply a subtle drop shadow for robustness across platforms:
+            # smaller blur, no vertical offset, semi-transparent color. It is
+            # created on the widget's first focus and re-enabled afterwards.
+            shadow = widget.graphicsEffect()
+            if shadow is None:
                 shadow = QGraphicsDropShadowEffect(widget)
                 shadow.setBlurRadius(8)
                 shadow.setXOffset(0)
                 shadow.setYOffset(0)
-                try:
-                    qcol = QColor(fq['border_focus'])
-                    qcol.setAlpha(140)
-                    shadow.setColor(qcol)
-                except Exception:
-                    shadow.setColor(QColor(fq['border_focus']))
+                shadow.setColor(_FOCUS_SHADOW_COLOR)
                 widget.setGraphicsEffect(shadow)
-            except Exception:
-                logging.exception("SnippetDialog: failed to apply drop shadow on %s", getattr(widget, 'objectName', lambda: '')())
+            else:
+                shadow.setEnabled(True)
         except Exception:
-            logging.exception("SnippetDialog._apply_inline_focus_style error")
+            logger.exception("SnippetDialog._apply_inline_focus_style error")
 
     def _remove_inline_focus_style(self, widget):
         """Restore the original inline stylesheet for `widget`."""
         try:
             if widget is None:
                 return
-            key = id(widget)
-            orig = self._orig_inline_styles.get(key, None)
+            orig = widget.property(_ORIG_STYLE_PROPERTY)
             if orig is not None:
-                try:
-                    widget.setStyleSheet(orig)
-                except Exception:
-                    logging.exception("SnippetDialog: failed to restore inline style on %s", getattr(widget, 'objectName', lambda: '')())
-                try:
-                    del self._orig_inline_styles[key]
-                except Exception:
-                    pass
-            # Remove any graphics effect we may have applied
-            try:
-                ge = widget.graphicsEffect()
-                if ge is not None:
-                    try:
-                        widget.setGraphicsEffect(None)
-                    except Exception:
-                        pass
-            except Exception:
-                logging.exception("SnippetDialog: failed to remove graphics effect on %s", getattr(widget, 'objectName', lambda: '')())
+                widget.setStyleSheet(orig)
+                widget.setProperty(_ORIG_STYLE_PROPERTY, None)
+            # Switch off the focus shadow; it is kept for the next focus-in
+            shadow = widget.graphicsEffect()
+            if shadow is not None:
+                shadow.setEnabled(False)
         except Exception:
-            logging.exception("SnippetDialog._remove_inline_focus_style error")
+            logger.exception("SnippetDialog._remove_inline_focus_style error")
+
     def _populate_fields(self):
-        """Populate form fields if editing an existing snippet."""
+        """Populate form fields if editing an existing snippet, then validate once."""
         if self.snippet:
-            self.name_edit.setText(self.snippet.name)
-            self.description_edit.setPlainText(self.snippet.description)
-            self.command_edit.setPlainText(self.snippet.command_text)
-            self.tags_edit.setText(self.snippet.tags)
+            # Keep the per-field validation slots quiet while filling in
+            # the form; the single _validate_input below covers all fields.
+            with QSignalBlocker(self.name_edit), QSignalBlocker(self.description_edit), \
+                    QSignalBlocker(self.command_edit), QSignalBlocker(self.tags_edit):
+                self.name_edit.setText(self.snippet.name)
+                self.description_edit.setPlainText(self.snippet.description)
+                self.command_edit.setPlainText(self.snippet.command_text)
+                self.tags_edit.setText(self.snippet.tags)
+
+        self._validate_input()
 
     def _connect_signals(self):
         """Connect signals to their corresponding slots."""
-        self.button_box.accepted.connect(self._on_save)
-        self.button_box.rejected.connect(self.reject)
+        # Every sender lives on the GUI thread with the dialog, so direct
+        # connections skip AutoConnection's per-emit thread check.
+        direct = Qt.ConnectionType.DirectConnection
+        self.button_box.accepted.connect(self._on_save, direct)
+        self.button_box.rejected.connect(self.reject, direct)
 
         # Enable/disable save button based on required fields
-        self.name_edit.textChanged.connect(self._validate_input)
-        self.command_edit.textChanged.connect(self._validate_input)
-
-        # Initial validation
-        self._validate_input()
+        self.name_edit.textChanged.connect(self._on_name_changed, direct)
+        self.command_edit.textChanged.connect(self._on_command_changed, direct)
 
     def _diagnose(self, w, label: str):
         """Log diagnostics about a widget's style, palette and attributes."""
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
         try:
             if not w:
                 logger.debug("SnippetDialog.diagnose: %s is None", label)
@@ -500,7 +464,8 @@ class SnippetDialog(QDialog):
             cls = type(w).__name__
             ss = (w.styleSheet() or '')
             ss_len = len(ss)
-            has_effect = getattr(w, 'graphicsEffect', lambda: None)() is not None
+            effect = getattr(w, 'graphicsEffect', lambda: None)()
+            has_effect = effect is not None and effect.isEnabled()
             mac_focus = False
             opaque = None
             try:
@@ -538,76 +503,54 @@ class SnippetDialog(QDialog):
         except Exception:
             logger.exception("SnippetDialog.diagnose: failed for %s", label)
 
-    def _on_focus_changed(self, old, now):
-        """Clear selection in text edits when they lose focus."""
-        try:
-            old_name = getattr(old, 'objectName', lambda: None)() if old else None
-            now_name = getattr(now, 'objectName', lambda: None)() if now else None
-            logging.debug("SnippetDialog._on_focus_changed: old=%s (%s), now=%s (%s)", old, old_name, now, now_name)
-
-            # Extra diagnostics for focused widgets
-            self._diagnose(old, 'old')
-            self._diagnose(now, 'now')
-            # If an internal QTextEdit lost focus, clear its selection
-            for edit in (self.description_edit, self.command_edit, self.name_edit, self.tags_edit):
-                if old is edit and now is not edit:
-                    # QTextEdit selection
-                    if isinstance(edit, QTextEdit):
-                        cursor = edit.textCursor()
-                        if cursor.hasSelection():
-                            cursor.clearSelection()
-                            edit.setTextCursor(cursor)
-                            try:
-                                edit.viewport().update()
-                            except Exception:
-                                pass
-                            logger.debug("SnippetDialog: cleared selection on %s", getattr(edit, 'objectName', lambda: '')())
-                    else:
-                        # QLineEdit: try to deselect
-                        try:
-                            edit.deselect()
-                        except Exception:
-                            try:
-                                edit.setSelection(0, 0)
-                            except Exception:
-                                pass
-                        logger.debug("SnippetDialog: deselected QLineEdit %s", getattr(edit, 'objectName', lambda: '')())
-        except Exception:
-            pass
-
-    def _create_glow(self):
-        # Glow creation removed — leave placeholder in case future work
-        # needs a programmatic effect. Do not apply graphical effects here.
-        return None
-
-    def _apply_glow(self, widget):
-        # Glow application removed — intentionally no-ops to keep UI unchanged
-        return
-
-    def _remove_glow(self, widget):
-        # Glow removal removed — intentionally no-ops
-        return
-
-    def closeEvent(self, event):
-        """Cleanup: disconnect focusChanged handler when dialog closes."""
-        try:
-            app = QApplication.instance()
-            if app:
-                try:
-                    app.focusChanged.disconnect(self._on_focus_changed)
-                except Exception:
-                    pass
-        except Exception:
-            pass
-        super().closeEvent(event)
+    def _clear_selection(self, edit):
+        """Clear any text selection in `edit` after it loses focus."""
+        if isinstance(edit, QPlainTextEdit):
+            cursor = edit.textCursor()
+            if cursor.hasSelection():
+                cursor.clearSelection()
+                edit.setTextCursor(cursor)
+                edit.viewport().update()
+                logger.debug("SnippetDialog: cleared selection on %s", edit.objectName())
+        else:
+            edit.deselect()
+            logger.debug("SnippetDialog: deselected QLineEdit %s", edit.objectName())
 
     def _validate_input(self):
         """Validate input and enable/disable save button accordingly."""
-        name_valid = bool(self.name_edit.text().strip())
-        command_valid = bool(self.command_edit.toPlainText().strip())
-
-        save_button = self.button_box.button(QDialogButtonBox.StandardButton.Save)
-        save_button.setEnabled(name_valid and command_valid)
+        self._name_valid = bool(self.name_edit.text().strip())
+        # document().isEmpty() is O(1); toPlainText() would copy the whole
+        # command on every keystroke. Whitespace-only commands are still
+        # rejected by validate_input on save.
+        self._command_valid = not self.command_edit.document().isEmpty()
+        self._command_text = None
+        self._can_save = None
+        self._update_save_button()
+
+    def _on_name_changed(self, text: str):
+        """Track whether the name is filled in, using the signal's text."""
+        self._name_valid = bool(text.strip())
+        self._update_save_button()
+
+    def _on_command_changed(self):
+        """Track whether the command is filled in."""
+        self._command_valid = not self.command_edit.document().isEmpty()
+        self._command_text = None
+        self._update_save_button()
+
+    def _stripped_command(self) -> str:
+        """Return the stripped command text, copied out of the editor once per edit."""
+        if self._command_text is None:
+            self._command_text = self.command_edit.toPlainText().strip()
+        return self._command_text
+
+    def _update_save_button(self):
+        """Enable the save button only when both required fields are set."""
+        can_save = self._name_valid and self._command_valid
+        if can_save == self._can_save:
+            return
+        self._can_save = can_save
+        self._save_button.setEnabled(can_save)
 
     def _on_save(self):
         """Handle save button click with validation."""
@@ -621,10 +564,11 @@ class SnippetDialog(QDialog):
         Returns:
             True if all required fields are valid, False otherwise
         """
-        name = self.name_edit.text().strip()
-        command_text = self.command_edit.toPlainText().strip()
-
-        if not name:
+        self._ensure_ui()
+        # The save button is gated on the cached field state, but Ctrl+Enter
+        # bypasses it, so the required checks still apply here. The name
+        # state is exact; the command state can't see whitespace-only text.
+        if not self._name_valid:
             QMessageBox.warning(
                 self,
                 "Validation Error",
@@ -633,7 +577,7 @@ class SnippetDialog(QDialog):
             self.name_edit.setFocus()
             return False
 
-        if not command_text:
+        if not self._stripped_command():
             QMessageBox.warning(
                 self,
                 "Validation Error",
@@ -643,7 +587,7 @@ class SnippetDialog(QDialog):
             return False
 
         # Check for reasonable name length
-        if len(name) > 100:
+        if len(self.name_edit.text().strip()) > 100:
             QMessageBox.warning(
                 self,
                 "Validation Error",
@@ -661,18 +605,19 @@ class SnippetDialog(QDialog):
         Returns:
             Dictionary containing the snippet data
         """
+        self._ensure_ui()
         return {
             'name': self.name_edit.text().strip(),
             'description': self.description_edit.toPlainText().strip(),
-            'command_text': self.command_edit.toPlainText().strip(),
+            'command_text': self._stripped_command(),
             'tags': self.tags_edit.text().strip()
         }
 
     def keyPressEvent(self, event):
         """Handle key press events."""
-        # Allow Ctrl+Enter to save
-        if event.key() == Qt.Key.Key_Return and event.modifiers() == Qt.KeyboardModifier.ControlModifier:
-            if self.validate_input():
-                self.accept()
+        # Allow Ctrl+Enter to save. Check the modifiers first: most keys
+        # arrive without Ctrl, so key() is rarely needed.
+        if event.modifiers() == _SAVE_MODIFIER and event.key() == _SAVE_KEY:
+            self._on_save()
         else:
             super().keyPressEvent(event)
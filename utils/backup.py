@@ -2,18 +2,106 @@
 Backup and restore functionality for the Command Snippet Management Application.
 """
 
+import heapq
 import json
 import sqlite3
 import shutil
 import os
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing, contextmanager
 from datetime import datetime
-from typing import List, Dict, Any
+from functools import lru_cache
+from itertools import islice
+from typing import List, Dict, Any, Optional, Union, BinaryIO, Iterator
 from pathlib import Path
 from db.models import Snippet
 from utils.logger import get_logger
 
+try:
+    import orjson
+except ImportError:  # optional speedup; fall back to the stdlib encoder
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # optional; JSON imports are then parsed in one go
+    ijson = None
+
 logger = get_logger(__name__)
 
+# Snippets inserted per executemany() call during an import
+_IMPORT_BATCH_SIZE = 1000
+
+# Upper bound on threads used to read snapshot metadata in list_snapshots
+_SNAPSHOT_READ_WORKERS = 8
+
+# Connection settings applied during bulk work (see configure_connection).
+# sqlite3.connect already sets a 5 second busy timeout.
+_CONNECTION_PRAGMAS = {
+    'cache_size': -20000,  # ~20MB page cache for bulk imports
+    'temp_store': 2,       # MEMORY
+}
+
+
+@contextmanager
+def configure_connection(db_connection: sqlite3.Connection) -> Iterator[None]:
+    """
+    Apply connection-level PRAGMAs for bulk work for the duration of the block.
+
+    The previous values are restored on exit, so a shared connection is left
+    as it was found. The journal mode and synchronous level are left to the
+    database module; an import runs as a single transaction, so it only
+    syncs once.
+
+    Args:
+        db_connection: Active database connection
+    """
+    previous = {
+        name: db_connection.execute(f"PRAGMA {name}").fetchone()[0]
+        for name in _CONNECTION_PRAGMAS
+    }
+    for name, value in _CONNECTION_PRAGMAS.items():
+        db_connection.execute(f"PRAGMA {name}={value}")
+    try:
+        yield
+    finally:
+        for name, value in previous.items():
+            db_connection.execute(f"PRAGMA {name}={value}")
+
+
+def _json_bytes(obj: Any) -> bytes:
+    """Encode obj as JSON indented by 2 spaces, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode('utf-8')
+
+
+# Marks the header line of a newline-delimited export (export_snippets_to_file)
+_NDJSON_FORMAT = 'csm-ndjson'
+
+# Snippet fields written by the exports, in column order
+_EXPORT_COLUMNS = ('id', 'name', 'description', 'command_text', 'tags', 'last_used', 'created_at')
+_EXPORT_SNIPPETS_SQL = f"""
+    SELECT {', '.join(_EXPORT_COLUMNS)}
+    FROM snippets
+    ORDER BY created_at
+"""
+
+
+def _iter_export_rows(db_connection: sqlite3.Connection) -> Iterator[Dict[str, Any]]:
+    """
+    Run the export query and return an iterator over its snippets as dicts
+    keyed by _EXPORT_COLUMNS. The query runs immediately, so errors surface
+    before the caller writes anything.
+    """
+    cursor = db_connection.cursor()
+    # Plain tuples are cheaper to zip than sqlite3.Row, which the
+    # connection itself may use
+    cursor.row_factory = None
+    cursor.execute(_EXPORT_SNIPPETS_SQL)
+    return (dict(zip(_EXPORT_COLUMNS, row)) for row in cursor)
+
+
 def export_snippets_to_json(db_connection: sqlite3.Connection) -> str:
     """
     Export all snippets from the database to JSON format.
@@ -24,51 +112,241 @@ def export_snippets_to_json(db_connection: sqlite3.Connection) -> str:
     Returns:
         JSON string containing all snippets
     """
-    cursor = db_connection.cursor()
-    cursor.row_factory = sqlite3.Row
-
     try:
-        cursor.execute("""
-            SELECT id, name, description, command_text, tags,
-                   last_used, created_at
-            FROM snippets
-            ORDER BY created_at
-        """)
-        rows = cursor.fetchall()
-
-        snippets = []
-        for row in rows:
-            snippet_dict = {
-                'id': row['id'],
-                'name': row['name'],
-                'description': row['description'],
-                'command_text': row['command_text'],
-                'tags': row['tags'],
-                'last_used': row['last_used'],
-                'created_at': row['created_at']
-            }
-            snippets.append(snippet_dict)
-
         export_data = {
             'version': 1,
             'exported_at': datetime.now().isoformat(),
-            'snippets': snippets
+            'snippets': list(_iter_export_rows(db_connection))
         }
 
-        return json.dumps(export_data, indent=2)
+        return _json_bytes(export_data).decode('utf-8')
+
+    except Exception as e:
+        logger.error("Failed to export snippets: %s", str(e))
+        raise Exception(f"Failed to export snippets: {e}")
+
+
+def export_snippets_to_file(db_connection: sqlite3.Connection, file_path: str) -> int:
+    """
+    Stream all snippets to a newline-delimited JSON file.
+
+    The first line is a header object
+    ({"format": "csm-ndjson", "version": ..., "exported_at": ...})
+    and every following line holds one snippet. Rows are written as they are
+    read from the cursor, so memory use doesn't grow with the number of
+    snippets. The file can be read back with import_snippets_from_json.
+
+    Args:
+        db_connection: Active database connection
+        file_path: Path of the file to write
+
+    Returns:
+        Number of snippets written
+    """
+    if orjson is not None:
+        dumps = orjson.dumps
+    else:
+        def dumps(obj):
+            return json.dumps(obj).encode('utf-8')
+
+    try:
+        rows = _iter_export_rows(db_connection)
+
+        count = 0
+        with open(file_path, 'wb') as f:
+            f.write(dumps({
+                'format': _NDJSON_FORMAT,
+                'version': 1,
+                'exported_at': datetime.now().isoformat()
+            }))
+            f.write(b'\n')
+            for row in rows:
+                f.write(dumps(row))
+                f.write(b'\n')
+                count += 1
+
+        logger.info("Exported %d snippets to %s", count, file_path)
+        return count
 
     except Exception as e:
         logger.error("Failed to export snippets: %s", str(e))
         raise Exception(f"Failed to export snippets: {e}")
 
-def import_snippets_from_json(db_connection: sqlite3.Connection, json_data: str,
-                            replace_existing: bool = False) -> Dict[str, Any]:
+
+# Missing timestamps fall back to the schema's CURRENT_TIMESTAMP default
+# instead of being stored as NULL
+_INSERT_SNIPPET_SQL = """
+    INSERT INTO snippets
+    (name, description, command_text, tags, last_used, created_at)
+    VALUES (?, ?, ?, ?, COALESCE(?, CURRENT_TIMESTAMP), COALESCE(?, CURRENT_TIMESTAMP))
+"""
+
+
+def _snippet_row(snippet_data: Any) -> Optional[tuple]:
+    """
+    Build the INSERT parameters for one exported snippet (its ID is dropped).
+
+    Returns:
+        Parameter tuple, or None if the snippet has no name or command
+    """
+    if not isinstance(snippet_data, dict):
+        return None
+
+    name = snippet_data.get('name')
+    command_text = snippet_data.get('command_text')
+    if not name or not isinstance(name, str) or not command_text or not isinstance(command_text, str):
+        return None
+
+    return (
+        name,
+        snippet_data.get('description', ''),
+        command_text,
+        snippet_data.get('tags', ''),
+        snippet_data.get('last_used'),
+        snippet_data.get('created_at')
+    )
+
+
+def _load_backup_snippets(json_data: str) -> List[Dict[str, Any]]:
+    """
+    Parse exported data into its list of snippets.
+
+    Accepts both the single JSON document written by export_snippets_to_json
+    and the newline-delimited format written by export_snippets_to_file, whose
+    first line is a header object marked with _NDJSON_FORMAT.
+
+    Raises:
+        ValueError: If the data is not a snippet export
+    """
+    header_line, _, rest = json_data.partition('\n')
+    header = _parse_ndjson_header(header_line)
+
+    if header is not None:
+        snippets = [json.loads(line) for line in rest.splitlines() if line.strip()]
+        if not snippets:
+            raise ValueError("Invalid backup format: no snippets after the header")
+        return snippets
+
+    data = json.loads(json_data)
+    if 'version' not in data or 'snippets' not in data:
+        raise ValueError("Invalid backup format")
+    return data['snippets']
+
+
+def _parse_ndjson_header(line: Union[str, bytes]) -> Optional[Dict[str, Any]]:
+    """Return the header of a newline-delimited export, or None if `line` isn't one."""
+    try:
+        header = json.loads(line)
+    except ValueError:
+        return None
+
+    if isinstance(header, dict) and header.get('format') == _NDJSON_FORMAT:
+        return header
+    return None
+
+
+def _stream_backup_snippets(backup_file: BinaryIO) -> Iterator[Dict[str, Any]]:
+    """
+    Yield the snippets of an export read from a binary file, one at a time.
+
+    Newline-delimited exports are read line by line. A JSON document is
+    streamed with ijson when it is installed; otherwise it is parsed whole.
+    """
+    header = _parse_ndjson_header(backup_file.readline())
+    if header is not None:
+        found = False
+        for line in backup_file:
+            if line.strip():
+                found = True
+                yield json.loads(line)
+        if not found:
+            raise ValueError("Invalid backup format: no snippets after the header")
+        return
+
+    backup_file.seek(0)
+    if ijson is None:
+        yield from _load_backup_snippets(backup_file.read().decode('utf-8'))
+        return
+
+    # Check the top-level keys without building any values; exports write
+    # 'version' first, so this normally stops after a few events
+    keys = set()
+    for prefix, event, value in ijson.parse(backup_file):
+        if prefix == '' and event == 'map_key':
+            keys.add(value)
+            if {'version', 'snippets'} <= keys:
+                break
+    else:
+        raise ValueError("Invalid backup format")
+
+    backup_file.seek(0)
+    yield from ijson.items(backup_file, 'snippets.item', use_float=True)
+
+
+def _import_batch(cursor: sqlite3.Cursor, batch: List[Dict[str, Any]],
+                  stats: Dict[str, int]) -> None:
+    """
+    Insert one batch of snippets, updating the import statistics.
+
+    Snippets without a name or command are counted as failed up front, and
+    the rest are inserted with a single executemany(). If that fails, it is
+    rolled back and the rows are inserted one by one so that per-snippet
+    failures can be counted.
+    """
+    rows = []
+    for snippet_data in batch:
+        row = _snippet_row(snippet_data)
+        if row is None:
+            name = snippet_data.get('name', 'unknown') if isinstance(snippet_data, dict) else 'unknown'
+            logger.error("Failed to import snippet %s: missing name or command", name)
+            stats['failed'] += 1
+        else:
+            rows.append(row)
+
+    if not rows:
+        return
+
+    # IDs are not part of the row, so SQLite auto-generates new ones
+    cursor.execute("SAVEPOINT import_batch")
+    try:
+        cursor.executemany(_INSERT_SNIPPET_SQL, rows)
+        cursor.execute("RELEASE import_batch")
+        stats['imported'] += len(rows)
+        return
+    except Exception as e:
+        logger.warning("Batch import failed (%s); importing snippets one by one", str(e))
+        cursor.execute("ROLLBACK TO import_batch")
+        cursor.execute("RELEASE import_batch")
+
+    for row in rows:
+        try:
+            cursor.execute(_INSERT_SNIPPET_SQL, row)
+            stats['imported'] += 1
+
+        except Exception as e:
+            logger.error("Failed to import snippet %s: %s", row[0], str(e))
+            stats['failed'] += 1
+
+
+def import_snippets_from_json(db_connection: sqlite3.Connection,
+                              json_data: Union[str, BinaryIO],
+                              replace_existing: bool = False) -> Dict[str, Any]:
     """
     Import snippets from JSON format into the database.
 
+    Both the JSON document from export_snippets_to_json and the
+    newline-delimited file from export_snippets_to_file are accepted. When a
+    file opened in binary mode is passed, snippets are read from it as they
+    are imported instead of being loaded all at once.
+
+    Snippets are inserted in batches of _IMPORT_BATCH_SIZE, all in one
+    transaction (see _import_batch). If the data holds no snippet that can
+    be imported, the transaction is rolled back, so replace_existing never
+    clears the library for a file that isn't a snippet export.
+
     Args:
         db_connection: Active database connection
-        json_data: JSON string containing snippets
+        json_data: JSON string, or binary file object, containing snippets
         replace_existing: If True, clear existing snippets before import
 
     Returns:
@@ -77,56 +355,80 @@ def import_snippets_from_json(db_connection: sqlite3.Connection, json_data: str,
     cursor = db_connection.cursor()
 
     try:
-        data = json.loads(json_data)
-
-        if 'version' not in data or 'snippets' not in data:
-            raise ValueError("Invalid backup format")
+        if isinstance(json_data, str):
+            snippets = iter(_load_backup_snippets(json_data))
+        else:
+            snippets = _stream_backup_snippets(json_data)
 
         stats = {
-            'total': len(data['snippets']),
+            'total': 0,
             'imported': 0,
             'skipped': 0,
             'failed': 0
         }
 
-        if replace_existing:
-            logger.info("Clearing existing snippets before import")
-            cursor.execute("DELETE FROM snippets")
+        # The connection commits when the block completes and rolls back
+        # if anything in it raises
+        with configure_connection(db_connection), db_connection:
+            if not db_connection.in_transaction:
+                cursor.execute("BEGIN IMMEDIATE")
 
-        for snippet_data in data['snippets']:
-            try:
-                # Remove ID to let SQLite auto-generate new ones
-                snippet_data.pop('id', None)
-
-                cursor.execute("""
-                    INSERT INTO snippets
-                    (name, description, command_text, tags, last_used, created_at)
-                    VALUES (?, ?, ?, ?, ?, ?)
-                """, (
-                    snippet_data['name'],
-                    snippet_data['description'],
-                    snippet_data['command_text'],
-                    snippet_data['tags'],
-                    snippet_data['last_used'],
-                    snippet_data['created_at']
-                ))
-                stats['imported'] += 1
+            if replace_existing:
+                logger.info("Clearing existing snippets before import")
+                cursor.execute("DELETE FROM snippets")
 
-            except Exception as e:
-                logger.error("Failed to import snippet %s: %s",
-                           snippet_data.get('name', 'unknown'), str(e))
-                stats['failed'] += 1
+            while True:
+                batch = list(islice(snippets, _IMPORT_BATCH_SIZE))
+                if not batch:
+                    break
+                stats['total'] += len(batch)
+                _import_batch(cursor, batch, stats)
+
+            # Raising rolls back the transaction, including the DELETE above
+            if stats['total'] and not stats['imported']:
+                raise ValueError("Invalid backup format: no valid snippets")
 
-        db_connection.commit()
         logger.info("Import completed: %s", stats)
         return stats
 
     except Exception as e:
-        db_connection.rollback()
         logger.error("Import failed: %s", str(e))
         raise Exception(f"Failed to import snippets: {e}")
 
 
+def _connect_read_only(db_path: str) -> sqlite3.Connection:
+    """
+    Open an existing database read-only.
+
+    Unlike a plain connect(), this fails instead of creating an empty
+    database when db_path doesn't exist, so callers need no exists() check.
+
+    Raises:
+        FileNotFoundError: If the database can't be opened
+    """
+    uri = f"{Path(os.path.abspath(db_path)).as_uri()}?mode=ro"
+    try:
+        return sqlite3.connect(uri, uri=True)
+    except sqlite3.OperationalError as e:
+        raise FileNotFoundError(f"Database file not found: {db_path}") from e
+
+
+def _copy_database(source_path: str, target_path: str) -> None:
+    """
+    Copy an SQLite database with the online backup API.
+
+    Pages are copied under SQLite's own locking, so the copy is consistent
+    even while another connection has the database open, and an existing
+    database at target_path is replaced in place.
+
+    Raises:
+        FileNotFoundError: If source_path does not exist
+    """
+    with closing(_connect_read_only(source_path)) as source, \
+            closing(sqlite3.connect(target_path)) as target:
+        source.backup(target)
+
+
 def backup_database(db_path: str, backup_dir: str = None) -> str:
     """
     Create a backup copy of the SQLite database with timestamp.
@@ -153,11 +455,9 @@ def backup_database(db_path: str, backup_dir: str = None) -> str:
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S_%f')
         db_name = Path(db_path).stem
         backup_filename = f"{db_name}_backup_{timestamp}.db"
-        backup_path = os.path.join(backup_dir, backup_filename)        # Copy database file
-        if not os.path.exists(db_path):
-            raise FileNotFoundError(f"Database file not found: {db_path}")
+        backup_path = os.path.join(backup_dir, backup_filename)
 
-        shutil.copy2(db_path, backup_path)
+        _copy_database(db_path, backup_path)
         logger.info("Database backup created: %s", backup_path)
 
         return backup_path
@@ -183,18 +483,22 @@ def restore_database(backup_path: str, db_path: str, keep_backup: bool = True) -
         Exception: If restore fails
     """
     try:
+        # Checked up front so no safety backup is made for a restore that
+        # can't happen
         if not os.path.exists(backup_path):
             raise FileNotFoundError(f"Backup file not found: {backup_path}")
 
         # Create a safety backup of current DB before restore
-        if os.path.exists(db_path):
-            safety_timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-            safety_path = f"{db_path}.pre_restore_{safety_timestamp}"
-            shutil.copy2(db_path, safety_path)
+        safety_timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        safety_path = f"{db_path}.pre_restore_{safety_timestamp}"
+        try:
+            _copy_database(db_path, safety_path)
             logger.info("Safety backup created: %s", safety_path)
+        except FileNotFoundError:
+            logger.info("No current database to back up before restore")
 
         # Restore from backup
-        shutil.copy2(backup_path, db_path)
+        _copy_database(backup_path, db_path)
         logger.info("Database restored from backup: %s", backup_path)
 
         if not keep_backup:
@@ -223,33 +527,35 @@ def cleanup_old_backups(backup_dir: str, keep_count: int = 5) -> int:
         Exception: If cleanup fails
     """
     try:
-        if not os.path.exists(backup_dir):
+        try:
+            entries = os.scandir(backup_dir)
+        except FileNotFoundError:
             logger.warning("Backup directory not found: %s", backup_dir)
             return 0
 
         # Find all backup files (ending with _backup_*.db)
-        backup_files = []
-        for file in os.listdir(backup_dir):
-            if '_backup_' in file and file.endswith('.db'):
-                file_path = os.path.join(backup_dir, file)
-                backup_files.append({
-                    'path': file_path,
-                    'mtime': os.path.getmtime(file_path),
-                    'name': file
-                })
-
-        # Sort by modification time (newest first)
-        backup_files.sort(key=lambda x: x['mtime'], reverse=True)
+        with entries:
+            backup_files = [
+                entry for entry in entries
+                if '_backup_' in entry.name and entry.name.endswith('.db')
+            ]
+
+        # Pick the oldest backups beyond keep_count by modification time
+        old_backups = heapq.nsmallest(
+            max(0, len(backup_files) - keep_count),
+            backup_files,
+            key=lambda entry: entry.stat().st_mtime
+        )
 
         # Remove old backups
         deleted_count = 0
-        for backup in backup_files[keep_count:]:
+        for backup in old_backups:
             try:
-                os.remove(backup['path'])
-                logger.info("Deleted old backup: %s", backup['name'])
+                os.remove(backup.path)
+                logger.info("Deleted old backup: %s", backup.name)
                 deleted_count += 1
             except Exception as e:
-                logger.error("Failed to delete backup %s: %s", backup['name'], str(e))
+                logger.error("Failed to delete backup %s: %s", backup.name, str(e))
 
         logger.info("Cleanup completed: %d backups deleted", deleted_count)
         return deleted_count
@@ -272,25 +578,27 @@ def list_backups(backup_dir: str) -> List[Dict[str, Any]]:
     try:
         backups = []
 
-        if not os.path.exists(backup_dir):
+        try:
+            entries = os.scandir(backup_dir)
+        except FileNotFoundError:
             logger.warning("Backup directory not found: %s", backup_dir)
             return backups
 
-        for file in os.listdir(backup_dir):
-            if '_backup_' in file and file.endswith('.db'):
-                file_path = os.path.join(backup_dir, file)
-                try:
-                    stats = os.stat(file_path)
-                    backup_info = {
-                        'name': file,
-                        'path': file_path,
-                        'size_bytes': stats.st_size,
-                        'size_mb': stats.st_size / (1024 * 1024),
-                        'created': datetime.fromtimestamp(stats.st_mtime).isoformat()
-                    }
-                    backups.append(backup_info)
-                except Exception as e:
-                    logger.error("Failed to get info for backup %s: %s", file, str(e))
+        with entries:
+            for entry in entries:
+                if '_backup_' in entry.name and entry.name.endswith('.db'):
+                    try:
+                        stats = entry.stat()
+                        backup_info = {
+                            'name': entry.name,
+                            'path': entry.path,
+                            'size_bytes': stats.st_size,
+                            'size_mb': stats.st_size / (1024 * 1024),
+                            'created': datetime.fromtimestamp(stats.st_mtime).isoformat()
+                        }
+                        backups.append(backup_info)
+                    except Exception as e:
+                        logger.error("Failed to get info for backup %s: %s", entry.name, str(e))
 
         # Sort by creation time (newest first)
         backups.sort(key=lambda x: x['created'], reverse=True)
@@ -304,6 +612,33 @@ def list_backups(backup_dir: str) -> List[Dict[str, Any]]:
 # AUTO-SNAPSHOT FUNCTIONS
 # ========================================
 
+def _snapshot_database(db_path: str, snapshot_path: str) -> None:
+    """
+    Write a compacted copy of the database to snapshot_path with VACUUM INTO,
+    run on a read-only connection opened for this call.
+
+    The output is a fresh, self-consistent database file that needs no
+    journal or WAL file alongside it, and it leaves out free pages. If the
+    VACUUM fails (an old SQLite, an existing target file, or a full disk),
+    the database is copied with the backup API instead.
+
+    Raises:
+        FileNotFoundError: If db_path does not exist
+    """
+    try:
+        with closing(_connect_read_only(db_path)) as connection, configure_connection(connection):
+            connection.execute("VACUUM INTO ?", (snapshot_path,))
+    except sqlite3.Error as e:
+        logger.warning("VACUUM INTO %s failed (%s); copying the database instead", snapshot_path, str(e))
+        _copy_database(db_path, snapshot_path)
+
+
+@lru_cache(maxsize=16)
+def _auto_snapshot_root(db_path: str) -> Path:
+    """Return the auto-snapshot directory for a database (<db dir>/../backups/auto)."""
+    return Path(db_path).parent.parent / 'backups' / 'auto'
+
+
 def create_snapshot_before(db_path: str, operation: str, snippet_name: str) -> Dict[str, str]:
     """
     Create a BEFORE snapshot of the database before an operation.
@@ -317,20 +652,17 @@ def create_snapshot_before(db_path: str, operation: str, snippet_name: str) -> D
         Dictionary with snapshot info (backup_path, snapshot_id, timestamp)
     """
     try:
-        # Create auto-snapshot directory if needed
-        auto_snapshot_dir = os.path.dirname(db_path)
-        auto_snapshot_parent = os.path.join(os.path.dirname(auto_snapshot_dir), 'backups', 'auto')
-
         # Generate unique snapshot ID with microseconds
         now = datetime.now()
         timestamp = now.strftime('%Y%m%d_%H%M%S_%f')
-        snapshot_dir = os.path.join(auto_snapshot_parent, timestamp)
 
-        os.makedirs(snapshot_dir, exist_ok=True)
+        # Create auto-snapshot directory if needed
+        snapshot_dir = _auto_snapshot_root(db_path) / timestamp
+        snapshot_dir.mkdir(parents=True, exist_ok=True)
 
         # Create before backup
-        before_db_path = os.path.join(snapshot_dir, 'before.db')
-        shutil.copy2(db_path, before_db_path)
+        before_db_path = str(snapshot_dir / 'before.db')
+        _snapshot_database(db_path, before_db_path)
 
         # Create metadata JSON
         metadata = {
@@ -342,9 +674,9 @@ def create_snapshot_before(db_path: str, operation: str, snippet_name: str) -> D
             'status': 'in-progress'
         }
 
-        metadata_path = os.path.join(snapshot_dir, 'metadata.json')
-        with open(metadata_path, 'w') as f:
-            json.dump(metadata, f, indent=2)
+        metadata_path = snapshot_dir / 'metadata.json'
+        with open(metadata_path, 'wb') as f:
+            f.write(_json_bytes(metadata))
 
         logger.info(
             "Created BEFORE snapshot for %s operation on '%s': %s",
@@ -353,7 +685,7 @@ def create_snapshot_before(db_path: str, operation: str, snippet_name: str) -> D
 
         return {
             'backup_path': before_db_path,
-            'snapshot_dir': snapshot_dir,
+            'snapshot_dir': str(snapshot_dir),
             'snapshot_id': timestamp
         }
 
@@ -377,34 +709,37 @@ def create_snapshot_after(db_path: str, snapshot_id: str) -> Dict[str, str]:
         Dictionary with snapshot info (backup_path, snapshot_dir)
     """
     try:
-        # Locate the snapshot directory
-        auto_snapshot_parent = os.path.join(os.path.dirname(os.path.dirname(db_path)), 'backups', 'auto')
-        snapshot_dir = os.path.join(auto_snapshot_parent, snapshot_id)
-
-        if not os.path.exists(snapshot_dir):
-            logger.error("Snapshot directory not found: %s", snapshot_dir)
+        # Locate the snapshot directory; its metadata must exist
+        snapshot_dir = _auto_snapshot_root(db_path) / snapshot_id
+        metadata_path = snapshot_dir / 'metadata.json'
+
+        try:
+            metadata_file = open(metadata_path, 'r+b')
+        except FileNotFoundError:
+            logger.error("Snapshot metadata not found: %s", metadata_path)
             return {}
 
-        # Create after backup
-        after_db_path = os.path.join(snapshot_dir, 'after.db')
-        shutil.copy2(db_path, after_db_path)
+        # The metadata is read and rewritten through the one open file
+        with metadata_file:
+            metadata = json.loads(metadata_file.read())
 
-        # Update metadata JSON
-        metadata_path = os.path.join(snapshot_dir, 'metadata.json')
-        with open(metadata_path, 'r') as f:
-            metadata = json.load(f)
+            # Create after backup
+            after_db_path = str(snapshot_dir / 'after.db')
+            _snapshot_database(db_path, after_db_path)
 
-        metadata['after_timestamp'] = datetime.now().isoformat()
-        metadata['status'] = 'completed'
+            # Update metadata JSON
+            metadata['after_timestamp'] = datetime.now().isoformat()
+            metadata['status'] = 'completed'
 
-        with open(metadata_path, 'w') as f:
-            json.dump(metadata, f, indent=2)
+            metadata_file.seek(0)
+            metadata_file.truncate()
+            metadata_file.write(_json_bytes(metadata))
 
         logger.info("Created AFTER snapshot: %s", snapshot_dir)
 
         return {
             'backup_path': after_db_path,
-            'snapshot_dir': snapshot_dir
+            'snapshot_dir': str(snapshot_dir)
         }
 
     except Exception as e:
@@ -412,6 +747,47 @@ def create_snapshot_after(db_path: str, snapshot_id: str) -> Dict[str, str]:
         return {}
 
 
+def _file_size(path: Path) -> int:
+    """Return the size of a file in bytes, or 0 if it doesn't exist."""
+    try:
+        return os.stat(path).st_size
+    except FileNotFoundError:
+        return 0
+
+
+def _load_snapshot(auto_snapshot_parent: Path, snapshot_id: str) -> Optional[Dict]:
+    """
+    Read one snapshot's metadata and database sizes.
+
+    Returns:
+        Snapshot info dictionary, or None if the metadata is missing or unreadable
+    """
+    snapshot_dir = auto_snapshot_parent / snapshot_id
+    metadata_path = snapshot_dir / 'metadata.json'
+
+    try:
+        with open(metadata_path, 'r') as f:
+            metadata = json.load(f)
+
+        return {
+            'snapshot_id': snapshot_id,
+            'snapshot_dir': str(snapshot_dir),
+            'operation': metadata.get('operation', 'unknown'),
+            'snippet_name': metadata.get('snippet_name', 'unknown'),
+            'before_timestamp': metadata.get('before_timestamp', ''),
+            'after_timestamp': metadata.get('after_timestamp', ''),
+            'status': metadata.get('status', 'unknown'),
+            'before_size_mb': _file_size(snapshot_dir / 'before.db') / (1024 * 1024),
+            'after_size_mb': _file_size(snapshot_dir / 'after.db') / (1024 * 1024)
+        }
+
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.error("Failed to read metadata for snapshot %s: %s", snapshot_id, str(e))
+        return None
+
+
 def list_snapshots(db_path: str, limit: int = 10) -> List[Dict]:
     """
     List recent auto-snapshots with their metadata.
@@ -424,54 +800,31 @@ def list_snapshots(db_path: str, limit: int = 10) -> List[Dict]:
         List of dictionaries with snapshot metadata
     """
     try:
-        auto_snapshot_parent = os.path.join(os.path.dirname(os.path.dirname(db_path)), 'backups', 'auto')
+        auto_snapshot_parent = _auto_snapshot_root(db_path)
         snapshots = []
 
-        if not os.path.exists(auto_snapshot_parent):
+        try:
+            entries = os.scandir(auto_snapshot_parent)
+        except FileNotFoundError:
             logger.warning("Auto-snapshot directory not found: %s", auto_snapshot_parent)
             return snapshots
 
         # Get all snapshot directories
-        snapshot_dirs = sorted(
-            os.listdir(auto_snapshot_parent),
-            reverse=True
-        )
-
-        for snapshot_id in snapshot_dirs[:limit]:
-            snapshot_dir = os.path.join(auto_snapshot_parent, snapshot_id)
-            metadata_path = os.path.join(snapshot_dir, 'metadata.json')
-
-            if os.path.exists(metadata_path):
-                try:
-                    with open(metadata_path, 'r') as f:
-                        metadata = json.load(f)
-
-                    # Get file sizes
-                    before_size = 0
-                    after_size = 0
-                    before_path = os.path.join(snapshot_dir, 'before.db')
-                    after_path = os.path.join(snapshot_dir, 'after.db')
-
-                    if os.path.exists(before_path):
-                        before_size = os.path.getsize(before_path)
-                    if os.path.exists(after_path):
-                        after_size = os.path.getsize(after_path)
-
-                    snapshot_info = {
-                        'snapshot_id': snapshot_id,
-                        'snapshot_dir': snapshot_dir,
-                        'operation': metadata.get('operation', 'unknown'),
-                        'snippet_name': metadata.get('snippet_name', 'unknown'),
-                        'before_timestamp': metadata.get('before_timestamp', ''),
-                        'after_timestamp': metadata.get('after_timestamp', ''),
-                        'status': metadata.get('status', 'unknown'),
-                        'before_size_mb': before_size / (1024 * 1024),
-                        'after_size_mb': after_size / (1024 * 1024)
-                    }
-                    snapshots.append(snapshot_info)
-
-                except Exception as e:
-                    logger.error("Failed to read metadata for snapshot %s: %s", snapshot_id, str(e))
+        with entries:
+            snapshot_dirs = sorted(
+                (entry.name for entry in entries if entry.is_dir()),
+                reverse=True
+            )
+
+        # Each snapshot needs a few blocking reads; overlap them
+        snapshot_ids = snapshot_dirs[:limit]
+        if snapshot_ids:
+            with ThreadPoolExecutor(max_workers=min(_SNAPSHOT_READ_WORKERS, len(snapshot_ids))) as executor:
+                results = executor.map(
+                    lambda snapshot_id: _load_snapshot(auto_snapshot_parent, snapshot_id),
+                    snapshot_ids
+                )
+                snapshots = [info for info in results if info is not None]
 
         return snapshots
 
@@ -492,25 +845,23 @@ def cleanup_old_snapshots(db_path: str, keep_count: int = 5) -> int:
         Number of snapshots deleted
     """
     try:
-        auto_snapshot_parent = os.path.join(os.path.dirname(os.path.dirname(db_path)), 'backups', 'auto')
+        auto_snapshot_parent = _auto_snapshot_root(db_path)
 
-        if not os.path.exists(auto_snapshot_parent):
+        try:
+            snapshot_dirs = os.listdir(auto_snapshot_parent)
+        except FileNotFoundError:
             logger.warning("Auto-snapshot directory not found: %s", auto_snapshot_parent)
             return 0
 
-        # Get all snapshot directories sorted by time (newest first)
-        snapshot_dirs = sorted(
-            os.listdir(auto_snapshot_parent),
-            reverse=True
-        )
+        # Snapshot IDs are timestamps, so the smallest are the oldest
+        old_snapshots = heapq.nsmallest(max(0, len(snapshot_dirs) - keep_count), snapshot_dirs)
 
         deleted_count = 0
 
         # Delete snapshots beyond the keep_count
-        for snapshot_id in snapshot_dirs[keep_count:]:
-            snapshot_dir = os.path.join(auto_snapshot_parent, snapshot_id)
+        for snapshot_id in old_snapshots:
             try:
-                shutil.rmtree(snapshot_dir)
+                shutil.rmtree(auto_snapshot_parent / snapshot_id)
                 logger.info("Deleted old snapshot: %s", snapshot_id)
                 deleted_count += 1
             except Exception as e:
@@ -539,16 +890,13 @@ def restore_from_snapshot(db_path: str, snapshot_id: str, use_before: bool = Tru
         True if restore successful, False otherwise
     """
     try:
-        auto_snapshot_parent = os.path.join(os.path.dirname(os.path.dirname(db_path)), 'backups', 'auto')
-        snapshot_dir = os.path.join(auto_snapshot_parent, snapshot_id)
-
-        if not os.path.exists(snapshot_dir):
-            logger.error("Snapshot directory not found: %s", snapshot_dir)
-            return False
+        snapshot_dir = _auto_snapshot_root(db_path) / snapshot_id
 
-        # Choose which snapshot to restore from
+        # Choose which snapshot to restore from. Check it up front (this also
+        # covers a missing snapshot directory) so that no safety backup is
+        # made for a restore that can't happen.
         snapshot_file = 'before.db' if use_before else 'after.db'
-        snapshot_db_path = os.path.join(snapshot_dir, snapshot_file)
+        snapshot_db_path = str(snapshot_dir / snapshot_file)
 
         if not os.path.exists(snapshot_db_path):
             logger.error("Snapshot file not found: %s", snapshot_db_path)
@@ -566,10 +914,10 @@ def restore_from_snapshot(db_path: str, snapshot_id: str, use_before: bool = Tru
         )
 
         os.makedirs(os.path.dirname(safety_backup_path), exist_ok=True)
-        shutil.copy2(db_path, safety_backup_path)
+        _copy_database(db_path, safety_backup_path)
 
         # Restore from snapshot
-        shutil.copy2(snapshot_db_path, db_path)
+        _copy_database(snapshot_db_path, db_path)
 
         logger.info(
             "Restored database from snapshot %s (%s). Safety backup: %s",
@@ -6,14 +6,32 @@ import subprocess
 import os
 from PyQt6.QtWidgets import QApplication
 
+# osascript arguments for a script that runs its first argument in a new
+# Terminal.app window
+_TERMINAL_SCRIPT_ARGS = (
+    '-e', 'on run argv',
+    '-e', 'tell application "Terminal"',
+    '-e', 'activate',
+    '-e', 'do script (item 1 of argv)',
+    '-e', 'end tell',
+    '-e', 'end run',
+)
+
 def copy_to_clipboard(text: str) -> None:
     """
     Copy text to system clipboard.
 
     Args:
-        text: Text to copy
+        text: Text to copy; None or an empty string is ignored
     """
+    if not text:
+        return
+
+    # Setting the clipboard notifies every clipboard listener, so skip it
+    # when the same text is copied again
     clipboard = QApplication.clipboard()
+    if clipboard.text() == text:
+        return
     clipboard.setText(text)
 
 def execute_in_terminal_macos(command: str) -> None:
@@ -23,19 +41,10 @@ def execute_in_terminal_macos(command: str) -> None:
     Args:
         command: Command to execute
     """
-    # Escape single quotes in the command
-    escaped_command = command.replace("'", "'\\''")
-
-    # Create the AppleScript command
-    apple_script = f'''
-    tell application "Terminal"
-        activate
-        do script "{escaped_command}"
-    end tell
-    '''
-
-    # Execute the AppleScript
+    # The command is passed to the script as an argument, so it never has
+    # to be quoted or escaped into the AppleScript source; '--' stops
+    # osascript from reading a command that starts with '-' as an option
     try:
-        subprocess.run(['osascript', '-e', apple_script], check=True)
+        subprocess.run(['osascript', *_TERMINAL_SCRIPT_ARGS, '--', command], check=True)
     except subprocess.CalledProcessError as e:
         raise Exception(f"Failed to execute command in Terminal: {e}")
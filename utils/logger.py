@@ -2,23 +2,186 @@
 Logging configuration for the Command Snippet Management Application.
 """
 
+import atexit
 import os
+import queue
+import stat
 import sys
 import logging
 from datetime import datetime
-from logging.handlers import RotatingFileHandler
+from logging.handlers import MemoryHandler, QueueHandler, QueueListener, RotatingFileHandler
 
-# Create logs directory if it doesn't exist
-LOGS_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'logs')
-os.makedirs(LOGS_DIR, exist_ok=True)
+# Logs directory (CSM_LOG_DIR overrides it); created on the first write
+LOGS_DIR = os.environ.get('CSM_LOG_DIR') or os.path.join(os.path.dirname(os.path.dirname(__file__)), 'logs')
+
+# One log file per day the app is started, shared by every logger
+LOG_FILE = os.path.join(LOGS_DIR, f'snippets_{datetime.now():%Y%m%d}.log')
+
+# Level for every logger and handler; CSM_LOG_LEVEL=INFO (etc.) turns debug
+# calls into a single level check
+_env_level = os.environ.get('CSM_LOG_LEVEL', 'DEBUG').upper()
+LOG_LEVEL = _env_level if isinstance(logging.getLevelName(_env_level), int) else 'DEBUG'
 
 # Configure logging format
 LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-DEBUG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - [%(filename)s:%(lineno)d] - %(message)s'
 
-def setup_logger(name: str, level: str = 'DEBUG') -> logging.Logger:
+# Looking up the calling file and line costs a stack walk on every log call,
+# so the log file only records them when CSM_LOG_CALLER=1 is set
+LOG_CALLER = os.environ.get('CSM_LOG_CALLER') == '1'
+if LOG_CALLER:
+    DEBUG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - [%(filename)s:%(lineno)d] - %(message)s'
+else:
+    DEBUG_FORMAT = LOG_FORMAT
+    logging._srcfile = None  # skips Logger.findCaller (see the logging HOWTO)
+
+# Formatters shared by the file and console handlers. A fixed datefmt lets
+# formatTime use time.strftime alone, without appending milliseconds.
+_DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
+_FILE_FORMATTER = logging.Formatter(DEBUG_FORMAT, datefmt=_DATE_FORMAT)
+_CONSOLE_FORMATTER = logging.Formatter(LOG_FORMAT, datefmt=_DATE_FORMAT)
+
+# No format uses thread or process details; don't collect them per record
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
+
+# Records held in memory before they are written to the log file
+_FILE_BUFFER_RECORDS = 512
+# Longest time, in seconds, a buffered record waits before it is written out
+# (see _BatchingMemoryHandler.shouldFlush and the flush timer in main.py)
+LOG_FLUSH_INTERVAL = 5
+# Size of the log file's write buffer, in bytes
+_FILE_WRITE_BUFFER = 64 * 1024
+
+# Loggers already set up by get_logger, by name
+_LOGGER_CACHE: dict[str, logging.Logger] = {}
+
+
+class _BufferedRotatingFileHandler(RotatingFileHandler):
+    """
+    RotatingFileHandler that writes through a large block buffer.
+
+    The file (and the logs directory) is only created when the first record
+    is written, so importing this module touches no files.
+
+    Records are not flushed one by one; the buffer is written out when
+    flush() is called (once per batch, see _BatchingMemoryHandler) or when
+    it fills up. The rollover check keeps a running size count instead of
+    formatting each record twice and seeking and stat-ing the file.
+    """
+
+    def _open(self):
+        os.makedirs(LOGS_DIR, exist_ok=True)
+        stream = open(self.baseFilename, self.mode, buffering=_FILE_WRITE_BUFFER,
+                      encoding=self.encoding, errors=self.errors)
+        file_stat = os.fstat(stream.fileno())
+        self._file_size = file_stat.st_size
+        # Never roll over anything other than a regular file (bpo-45401)
+        self._can_rotate = stat.S_ISREG(file_stat.st_mode)
+        return stream
+
+    def emit(self, record):
+        try:
+            msg = self.format(record) + self.terminator
+            # maxBytes is in bytes; non-ASCII text (emoji titles) is longer encoded
+            size = len(msg.encode(self.encoding or 'utf-8', self.errors or 'strict'))
+            if self.stream is None:
+                self.stream = self._open()
+            if (self.maxBytes > 0 and self._can_rotate and self._file_size
+                    and self._file_size + size >= self.maxBytes):
+                self.doRollover()
+                if self.stream is None:
+                    self.stream = self._open()
+            self.stream.write(msg)
+            self._file_size += size
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
+class _BatchingMemoryHandler(MemoryHandler):
+    """
+    MemoryHandler that flushes its target once after handing over a batch.
+
+    A batch is also written out once its oldest record is LOG_FLUSH_INTERVAL
+    seconds old, so a slow trickle of records doesn't sit in memory.
+    """
+
+    def shouldFlush(self, record):
+        return (super().shouldFlush(record)
+                or record.created - self.buffer[0].created >= LOG_FLUSH_INTERVAL)
+
+    def flush(self):
+        super().flush()
+        if self.target:
+            self.target.flush()
+
+
+def _build_handlers() -> tuple:
+    """Create the file and console handlers that every logger writes through."""
+    # Rotating file handler (10MB max size, keep 5 backup files)
+    file_handler = _BufferedRotatingFileHandler(
+        LOG_FILE,
+        maxBytes=10*1024*1024,  # 10MB
+        backupCount=5,
+        encoding='utf-8',
+        delay=True
+    )
+    file_handler.setLevel(LOG_LEVEL)
+    file_handler.setFormatter(_FILE_FORMATTER)
+
+    # Buffer records and write them in batches; anything at WARNING or above
+    # is written straight away (together with what is buffered before it)
+    buffered_file_handler = _BatchingMemoryHandler(
+        capacity=_FILE_BUFFER_RECORDS,
+        flushLevel=logging.WARNING,
+        target=file_handler,
+        flushOnClose=True
+    )
+
+    console_handler = logging.StreamHandler(sys.stdout)
+    console_handler.setLevel(LOG_LEVEL)
+    console_handler.setFormatter(_CONSOLE_FORMATTER)
+
+    return buffered_file_handler, console_handler
+
+
+# Loggers only put records on this queue; a background listener thread does
+# the formatting and the file/console I/O
+_log_queue = queue.SimpleQueue()
+_queue_handler = QueueHandler(_log_queue)
+_file_handler, _console_handler = _build_handlers()
+_listener = QueueListener(_log_queue, _file_handler, _console_handler, respect_handler_level=True)
+_listener.start()
+
+
+def flush_logs() -> None:
+    """
+    Write any buffered log records to the log file.
+
+    Safe to call from any thread; the GUI calls it every LOG_FLUSH_INTERVAL
+    seconds so records don't wait for the next batch while the app is idle.
     """
-    Set up a logger with both file and console handlers.
+    _file_handler.flush()
+
+
+def _shutdown() -> None:
+    """Drain the queue, then write out whatever is still buffered."""
+    _listener.stop()
+    flush_logs()
+
+
+atexit.register(_shutdown)
+
+
+def setup_logger(name: str, level: str = LOG_LEVEL) -> logging.Logger:
+    """
+    Set up a logger that sends its records to the shared file and console handlers.
+
+    The logger itself only holds a QueueHandler; the records are formatted
+    and written by the background listener (see _build_handlers). Calling
+    this again for the same name is safe and only changes the level.
 
     Args:
         name: Name of the logger (usually __name__ of the module)
@@ -31,32 +194,15 @@ def setup_logger(name: str, level: str = 'DEBUG') -> logging.Logger:
     logger = logging.getLogger(name)
     logger.setLevel(level)
 
-    # Remove existing handlers to avoid duplicates
-    logger.handlers = []
+    # Handlers are added once per logger; a repeat call only updates the level
+    if getattr(logger, '_csm_configured', False):
+        return logger
 
-    # Create formatters
-    file_formatter = logging.Formatter(DEBUG_FORMAT)
-    console_formatter = logging.Formatter(LOG_FORMAT)
+    logger.addHandler(_queue_handler)
 
-    # Create rotating file handler (10MB max size, keep 5 backup files)
-    log_file = os.path.join(LOGS_DIR, f'snippets_{datetime.now().strftime("%Y%m%d")}.log')
-    file_handler = RotatingFileHandler(
-        log_file,
-        maxBytes=10*1024*1024,  # 10MB
-        backupCount=5,
-        encoding='utf-8'
-    )
-    file_handler.setLevel(logging.DEBUG)
-    file_handler.setFormatter(file_formatter)
-
-    # Create console handler
-    console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setLevel(logging.DEBUG)  # Set to DEBUG temporarily
-    console_handler.setFormatter(console_formatter)
-
-    # Add handlers to logger
-    logger.addHandler(file_handler)
-    logger.addHandler(console_handler)
+    # The queue handler covers everything; don't repeat records on the root logger
+    logger.propagate = False
+    logger._csm_configured = True
 
     return logger
 
@@ -64,10 +210,19 @@ def get_logger(name: str) -> logging.Logger:
     """
     Get or create a logger for a module.
 
+    The logger is set up on the first call for a name; later calls return
+    the same instance without touching its handlers.
+
     Args:
         name: Name of the logger (usually __name__ of the module)
 
     Returns:
         Logger instance
     """
-    return setup_logger(name)
+    cached = _LOGGER_CACHE.get(name)
+    if cached is not None:
+        return cached
+
+    logger = setup_logger(name)
+    _LOGGER_CACHE[name] = logger
+    return logger